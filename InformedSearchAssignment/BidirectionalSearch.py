@@ -0,0 +1,156 @@
+from collections import deque
+
+from Problem import *
+from Frontier import *
+from UninformedSearch import get_path
+from SearchStats import SearchStats
+
+
+def join_paths(problem: Problem, forward: Node, backward: Node) -> List[str]:
+    """
+    Takes in the Node where the forward search met the backward search
+    and the matching Node of the backward search. Returns the actions
+    from the initial state to the meeting state followed by the backward
+    actions undone in reverse order, which lead from the meeting state to the goal.
+    """
+    p = get_path(forward)
+    node = backward
+    while node.parent is not None:
+        p.append(problem.reverse_action(node.action))
+        node = node.parent
+    return p
+
+
+def _expand_layer(problem: Problem, frontier: deque, reached: dict, other_reached: dict,
+                  other_frontier: deque, stats: SearchStats) -> Any:
+    """
+    Expands every node in the current layer of a breadth first frontier.
+    Returns the pair (node, other node) with the lowest combined depth
+    where a child was already reached by the other search, or None.
+    """
+    best = None
+    for i in range(len(frontier)):
+        node = frontier.popleft()
+        children = problem.expand(node)
+        if stats is not None:
+            stats.expanding(len(frontier) + len(other_frontier) + 1, len(children))
+
+        for child in children:
+            key = problem.hashable_state(child.state)
+
+            if key not in reached:
+                reached[key] = child
+                frontier.append(child)
+
+                other = other_reached.get(key)
+                if other is not None and (best is None or child.depth + other.depth < best[0].depth + best[1].depth):
+                    best = (child, other)
+            elif stats is not None:
+                stats.duplicates += 1
+    return best
+
+
+def bidirectional_breadth_first_search(problem: Problem, stats: SearchStats = None) -> Any:
+    """
+    Takes in a Problem object that has an initial and goal state as
+     well as search operators (metohds). Runs one Breadth First Search from
+     the initial state and one from the goal, always growing the smaller
+     frontier by a full layer, until the two meet. Returns the shortest
+     path found or an empty list if no path is found.
+     stats is an optional SearchStats updated while searching. Both
+     frontiers count towards the frontier size.
+     """
+    if not problem.can_reach_goal():
+        return []
+
+    node = Node(problem.initial)
+
+    if problem.is_goal(node.state):
+        return get_path(node)
+
+    backward = problem.reverse()
+    goal = Node(backward.initial)
+
+    frontier = deque([node])
+    backward_frontier = deque([goal])
+    reached = {problem.hashable_state(node.state): node}
+    backward_reached = {backward.hashable_state(goal.state): goal}
+
+    while len(frontier) != 0 and len(backward_frontier) != 0:
+        if len(frontier) <= len(backward_frontier):
+            meet = _expand_layer(problem, frontier, reached, backward_reached, backward_frontier, stats)
+            if meet is not None:
+                return join_paths(problem, meet[0], meet[1])
+        else:
+            meet = _expand_layer(backward, backward_frontier, backward_reached, reached, frontier, stats)
+            if meet is not None:
+                return join_paths(problem, meet[1], meet[0])
+
+    return []
+
+
+def bidirectional_a_star(problem: Problem, frontier_type: type = HeapFrontier, stats: SearchStats = None) -> Any:
+    """
+    Takes in a Problem object that has an initial and goal state as
+     well as search operators (metohds). Runs A* from the initial state
+     towards the goal and from the goal towards the initial state, expanding
+     the side with the smaller frontier. Stops once no node left in either
+     frontier can lead to a cheaper path than the best meeting found, so the
+     path is optimal for consistent heuristics. Returns an empty list if no
+     path is found.
+     stats is an optional SearchStats updated while searching. Both
+     frontiers count towards the frontier size.
+     """
+    if not problem.can_reach_goal():
+        return []
+
+    node = Node(problem.initial)
+
+    if problem.is_goal(node.state):
+        return get_path(node)
+
+    backward = problem.reverse()
+    goal = Node(backward.initial)
+
+    # index 0 is the forward search and index 1 is the backward search
+    problems = [problem, backward]
+    frontiers = [frontier_type(), frontier_type()]
+    reached = [{}, {}]
+    for side, n in enumerate([node, goal]):
+        key = problems[side].hashable_state(n.state)
+        reached[side][key] = n
+        frontiers[side].push(key, problems[side].estimated_cost(n.state), n)
+
+    best = None
+    best_cost = float('inf')
+
+    while len(frontiers[0]) != 0 and len(frontiers[1]) != 0:
+        # every path not found yet costs at least the lowest f of either frontier
+        if best_cost <= max(frontiers[0].top_priority(), frontiers[1].top_priority()):
+            break
+
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        p = problems[side]
+        node = frontiers[side].pop()
+        children = p.expand(node)
+        if stats is not None:
+            stats.expanding(len(frontiers[0]) + len(frontiers[1]) + 1, len(children))
+
+        for child in children:
+            key = p.hashable_state(child.state)
+            old = reached[side].get(key)
+
+            if old is None or child.path_cost < old.path_cost:
+                reached[side][key] = child
+                frontiers[side].push(key, p.estimated_cost(child.state) + child.path_cost, child)
+
+                other = reached[1 - side].get(key)
+                if other is not None and child.path_cost + other.path_cost < best_cost:
+                    best_cost = child.path_cost + other.path_cost
+                    best = (child, other) if side == 0 else (other, child)
+            elif stats is not None:
+                stats.duplicates += 1
+
+    if best is None:
+        return []
+    return join_paths(problem, best[0], best[1])
@@ -0,0 +1,124 @@
+import heapq
+from abc import ABC, abstractmethod
+from typing import Any, List
+
+# marks a heap entry whose item was replaced by a cheaper one
+_REMOVED = object()
+
+
+class Frontier(ABC):
+    """
+    Priority queue used as the frontier of the informed searches. Items
+    are stored under a hashable key (usually problem.hashable_state) so a
+    state can only be in the frontier once and its priority can be lowered.
+    """
+
+    @abstractmethod
+    def push(self, key: Any, priority: float, item: Any) -> bool:
+        """
+        Adds an item to the frontier. If the key is already in the frontier
+        the item is only replaced when the new priority is lower (decrease-key)
+        :param key: hashable value that identifies the item
+        :param priority: lower priorities are returned first
+        :param item: object to store, usually a Node
+        :return: true if the item was added or replaced
+        """
+        pass
+
+    @abstractmethod
+    def pop(self) -> Any:
+        """
+        Removes and returns the item with the lowest priority. Ties
+        are returned in the order they were pushed.
+        :return: item with the lowest priority
+        """
+        pass
+
+    @abstractmethod
+    def top_priority(self) -> float:
+        """
+        Returns the lowest priority in the frontier without removing the item
+        :return: lowest priority or None if the frontier is empty
+        """
+        pass
+
+    @abstractmethod
+    def priority(self, key: Any) -> float:
+        """
+        Returns the priority of the item stored under key
+        :param key: hashable value that identifies the item
+        :return: priority of the item or None if the key is not in the frontier
+        """
+        pass
+
+    @abstractmethod
+    def items(self) -> List[tuple]:
+        """
+        Returns every item in the frontier, in no particular order
+        :return: list of (key, item) pairs
+        """
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """number of items in the frontier"""
+        pass
+
+    def __contains__(self, key: Any) -> bool:
+        """returns true if there is an item stored under key"""
+        return self.priority(key) is not None
+
+
+class HeapFrontier(Frontier):
+    """
+    Frontier backed by a heapq binary heap. Unlike queue.PriorityQueue it
+    takes no locks, which the single threaded searches do not need. A
+    decrease-key marks the old heap entry as removed and pushes a new one.
+    Removed entries are skipped when they reach the top of the heap.
+    """
+
+    def __init__(self):
+        self._heap: List[list] = []
+        # key -> live heap entry [priority, entry, item, key]
+        self._entries = {}
+        # breaks ties so items with the same priority come out in push order
+        self._count = 0
+
+    def push(self, key: Any, priority: float, item: Any) -> bool:
+        old = self._entries.get(key)
+        if old is not None:
+            if priority >= old[0]:
+                return False
+            old[2] = _REMOVED
+
+        entry = [priority, self._count, item, key]
+        self._count += 1
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        return True
+
+    def pop(self) -> Any:
+        heap = self._heap
+        while heap:
+            priority, count, item, key = heapq.heappop(heap)
+            if item is not _REMOVED:
+                del self._entries[key]
+                return item
+        raise KeyError("pop from an empty frontier")
+
+    def top_priority(self) -> float:
+        heap = self._heap
+        # drop removed entries so the top of the heap is a live item
+        while heap and heap[0][2] is _REMOVED:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def priority(self, key: Any) -> float:
+        entry = self._entries.get(key)
+        return None if entry is None else entry[0]
+
+    def items(self) -> List[tuple]:
+        return [(key, entry[2]) for key, entry in self._entries.items()]
+
+    def __len__(self) -> int:
+        return len(self._entries)
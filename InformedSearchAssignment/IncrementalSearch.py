@@ -0,0 +1,227 @@
+import heapq
+from typing import Dict
+
+from Problem import *
+from SearchStats import SearchStats
+
+INF = float('inf')
+
+
+class DStarLite:
+    """
+    Incremental planner for a maze whose cells change between queries
+    (D* Lite). The search runs backwards from the goal and keeps, for every
+    cell, its cost to the goal (g) and a one step lookahead of that cost
+    (rhs). When cells change only the cells whose costs become inconsistent
+    go back on the queue, so a small edit repairs a small part of the
+    previous search instead of starting over. The agent may also move along
+    the path between queries without losing the search.
+    """
+
+    def __init__(self, problem: Problem, terrain_cost: float = TERRAIN_COST, stats: SearchStats = None):
+        """
+        :param problem: MazeNavigation or CoordinateMazeNavigation giving the
+        maze layout, its cell costs and the start and goal locations
+        :param terrain_cost: cost of stepping onto a -1 cell added by update_cells
+        :param stats: optional SearchStats updated every time the path is repaired
+        """
+        grid, start, goal = problem.maze_layout()
+        self._height, self._width = grid.shape
+        self._terrain_cost = terrain_cost
+        self._stats = stats
+
+        # the maze is flattened with a border of impassable cells, so the
+        # neighbors of a cell are a fixed offset away and never out of range
+        self._padded_width = self._width + 2
+        padded = np.full((self._height + 2, self._padded_width), INF)
+        padded[1:-1, 1:-1] = problem.costs
+        self._costs = padded.ravel().tolist()
+        self._offsets = [d_row * self._padded_width + d_col for d_row, d_col in DIRECTIONS.values()]
+
+        self._start = self._index(start)
+        self._goal = self._index(goal)
+        self._reset()
+
+    def _reset(self):
+        """Throws away the search and starts again from the goal"""
+        finite = [c for c in self._costs if c != INF]
+        # the heuristic counts steps, so it is scaled by the cheapest cell
+        self._min_cost = min(finite) if len(finite) != 0 else 1.0
+        self._g = [INF] * len(self._costs)
+        self._rhs = [INF] * len(self._costs)
+        # heap of [key, cell] entries, stale ones are skipped when popped
+        self._queue = []
+        # cell -> key of its live entry in the queue
+        self._keys: Dict[int, tuple] = {}
+        # added to every key when the agent moves, instead of reordering the queue
+        self._km = 0
+        self._last = self._start
+
+        self._rhs[self._goal] = 0
+        self._push(self._goal, self._key(self._goal))
+
+    def _index(self, cell: Tuple[int, int]) -> int:
+        """flat index of a (row, col) cell"""
+        return (cell[0] + 1) * self._padded_width + cell[1] + 1
+
+    def _cell(self, index: int) -> Tuple[int, int]:
+        """(row, col) of a flat index"""
+        row, col = divmod(index, self._padded_width)
+        return row - 1, col - 1
+
+    def _heuristic(self, a: int, b: int) -> float:
+        """Manhattan distance between two flat indexes, scaled by the cheapest cell"""
+        row_a, col_a = divmod(a, self._padded_width)
+        row_b, col_b = divmod(b, self._padded_width)
+        return (abs(row_a - row_b) + abs(col_a - col_b)) * self._min_cost
+
+    def _key(self, cell: int) -> tuple:
+        """priority of a cell in the queue, compared as a tuple"""
+        m = min(self._g[cell], self._rhs[cell])
+        return m + self._heuristic(self._start, cell) + self._km, m
+
+    def _push(self, cell: int, key: tuple):
+        self._keys[cell] = key
+        heapq.heappush(self._queue, [key, cell])
+
+    def _top(self):
+        """drops stale entries and returns the live entry with the lowest key"""
+        queue = self._queue
+        while queue and self._keys.get(queue[0][1]) != queue[0][0]:
+            heapq.heappop(queue)
+        return queue[0] if queue else None
+
+    def _update(self, cell: int):
+        """
+        Recomputes the lookahead cost of a cell from its neighbors and puts
+        the cell in the queue if it no longer matches its cost to the goal
+        """
+        g = self._g
+        costs = self._costs
+        if cell != self._goal:
+            # moving into a neighbor costs that neighbor's cell cost
+            self._rhs[cell] = min(costs[cell + offset] + g[cell + offset] for offset in self._offsets)
+
+        self._keys.pop(cell, None)
+        if g[cell] != self._rhs[cell]:
+            self._push(cell, self._key(cell))
+
+    def _compute_path(self):
+        """Settles cells until the cost from the start to the goal is known"""
+        g = self._g
+        rhs = self._rhs
+        costs = self._costs
+        start = self._start
+        stats = self._stats
+
+        while True:
+            top = self._top()
+            if top is None or (top[0] >= self._key(start) and rhs[start] == g[start]):
+                return
+
+            key, cell = top
+            new_key = self._key(cell)
+            if key < new_key:
+                # the agent moved since the cell was queued
+                self._push(cell, new_key)
+                continue
+
+            heapq.heappop(self._queue)
+            del self._keys[cell]
+            if stats is not None:
+                stats.expanding(len(self._keys) + 1, len(self._offsets))
+
+            if g[cell] > rhs[cell]:
+                g[cell] = rhs[cell]
+            else:
+                g[cell] = INF
+                self._update(cell)
+            # cells that can step into this one. Impassable cells are never
+            # stepped from, so they are skipped
+            for offset in self._offsets:
+                neighbor = cell + offset
+                if costs[neighbor] != INF:
+                    self._update(neighbor)
+
+    @property
+    def start(self) -> Tuple[int, int]:
+        """(row, col) of the agent"""
+        return self._cell(self._start)
+
+    @property
+    def goal(self) -> Tuple[int, int]:
+        """(row, col) of the goal"""
+        return self._cell(self._goal)
+
+    def cost(self) -> float:
+        """
+        Returns the cost of the cheapest path from the agent to the goal
+        :return: path cost, inf if the goal can not be reached
+        """
+        self._compute_path()
+        return self._g[self._start]
+
+    def find_path(self) -> List[str]:
+        """
+        Returns the cheapest path from the agent to the goal on the maze as
+        it is now, repairing the previous search first
+        :return: list of actions in the same format as get_path, or an
+        empty list if the goal can not be reached
+        """
+        self._compute_path()
+        g = self._g
+        costs = self._costs
+        cell = self._start
+        if g[cell] == INF:
+            return []
+
+        p = [None]
+        while cell != self._goal:
+            # step to the neighbor with the cheapest cost to the goal
+            best = min(range(len(self._offsets)),
+                       key=lambda a: costs[cell + self._offsets[a]] + g[cell + self._offsets[a]])
+            p.append(ACTIONS[best])
+            cell += self._offsets[best]
+        return p
+
+    def move_to(self, cell: Tuple[int, int]):
+        """
+        Moves the agent, usually to a cell along the last path. The queue
+        keeps its order because every key is raised by the same amount
+        :param cell: (row, col) of the new agent location
+        """
+        new_start = self._index(cell)
+        self._km += self._heuristic(self._last, new_start)
+        self._last = new_start
+        self._start = new_start
+
+    def update_cells(self, changes: Dict[Tuple[int, int], int]):
+        """
+        Changes cells of the maze. Only the neighbors of the changed cells
+        are put back in the queue, the rest of the search is reused by the
+        next find_path
+        :param changes: (row, col) -> new maze value. 0s are impassable,
+        1s are walkable and -1s are walkable at terrain_cost
+        """
+        if len(changes) == 0:
+            return
+
+        cells = [self._index(cell) for cell in changes]
+        new_costs = cost_grid(np.array([list(changes.values())]), self._terrain_cost)[0].tolist()
+        for cell, cost in zip(cells, new_costs):
+            self._costs[cell] = cost
+
+        if min(new_costs) < self._min_cost:
+            # the heuristic would overestimate, so the old search can not be reused
+            self._reset()
+            return
+
+        # a changed cell changes the cost of stepping into it from each
+        # neighbor, and an opened cell can now be stepped from
+        for cell in cells:
+            if self._costs[cell] != INF:
+                self._update(cell)
+            for offset in self._offsets:
+                neighbor = cell + offset
+                if self._costs[neighbor] != INF:
+                    self._update(neighbor)
@@ -1,7 +1,9 @@
-import collections
+import time
+from typing import Iterator
 
 from Problem import *
-from queue import PriorityQueue
+from Frontier import *
+from SearchStats import SearchStats
 
 
 def get_path(node: Node)->List[str]:
@@ -18,77 +20,269 @@ def get_path(node: Node)->List[str]:
     return p
 
 
-def a_star(problem: Problem) -> Any:
+def a_star(problem: Problem, frontier_type: type = HeapFrontier, stats: SearchStats = None,
+           weight: float = 1) -> Any:
     """
     Takes in a Problem object that has an initial and goal state as
      well as search operators (metohds). Performs A*
      and returns the path found. Returns and empty list is no path is found.
+     A state that is reached again with a lower path cost replaces the
+     more expensive node in the frontier, so the returned path is optimal
+     for an admissible heuristic even when action costs differ.
+     frontier_type is the Frontier class used to order the nodes.
+     stats is an optional SearchStats updated while searching.
+     weight inflates the heuristic, f = g + weight * h. Weighted A* with a
+     weight above 1 expands fewer nodes and returns a path that costs at
+     most weight times the optimal cost.
+     Successors are streamed from problem.successors and a Node is only
+     made for the ones that are new or cheaper than before.
      """
+    if not problem.can_reach_goal():
+        return []
 
     node = Node(problem.initial)
 
     if problem.is_goal(node.state):
         return get_path(node)
 
-    entry = 0
-    frontier = PriorityQueue()
-    cost = problem.estimated_cost(node.state) + node.path_cost
-    frontier.put((cost, entry, node))
-    entry += 1
+    frontier = frontier_type()
+    key = problem.hashable_state(node.state)
+    frontier.push(key, weight * problem.estimated_cost(node.state) + node.path_cost, node)
 
-    reached = {problem.hashable_state(node.state): node}
+    reached = {key: node}
 
-    while frontier.qsize() != 0:
-        node = frontier.get()[2]
+    while len(frontier) != 0:
+        node = frontier.pop()
 
         if problem.is_goal(node.state):
             return get_path(node)
 
-        for child in problem.expand(node):
-            s = child.state
+        if stats is not None:
+            stats.expanding(len(frontier) + 1, 0)
 
-            if problem.hashable_state(s) not in reached:
-                reached[problem.hashable_state(s)] = child
-                cost = problem.estimated_cost(s) + child.path_cost
-                frontier.put((cost, entry, child))
-                entry += 1
+        for action, s, cost in problem.successors(node.state):
+            if stats is not None:
+                stats.generated += 1
+
+            key = problem.hashable_state(s)
+            best = reached.get(key)
+            path_cost = node.path_cost + cost
+
+            if best is None or path_cost < best.path_cost:
+                child = Node(s, node, action, path_cost, node.depth + 1)
+                reached[key] = child
+                frontier.push(key, weight * problem.estimated_cost(s) + path_cost, child)
+            elif stats is not None:
+                stats.duplicates += 1
 
     return []
 
 
-def greedy(problem: Problem) -> Any:
+def greedy(problem: Problem, frontier_type: type = HeapFrontier, stats: SearchStats = None) -> Any:
     """
     Takes in a Problem object that has an initial and goal state as
      well as search operators (metohds). Performs a Greedy Search
      and returns the path found. Returns and empty list is no path is found.
+     frontier_type is the Frontier class used to order the nodes.
+     stats is an optional SearchStats updated while searching.
+     Successors are streamed from problem.successors and a Node is only
+     made for the ones that were not reached before.
      """
+    if not problem.can_reach_goal():
+        return []
 
     node = Node(problem.initial)
 
     if problem.is_goal(node.state):
         return get_path(node)
 
-    entry = 0
-    frontier = PriorityQueue()
-    cost = problem.estimated_cost(node.state)
-    frontier.put((cost, entry, node))
-    entry += 1
+    frontier = frontier_type()
+    key = problem.hashable_state(problem.initial)
+    frontier.push(key, problem.estimated_cost(node.state), node)
 
-    reached = {problem.hashable_state(problem.initial): node}
+    reached = problem.reached_set()
+    reached.add(key)
 
-    while frontier.qsize() != 0:
-        node = frontier.get()[2]
+    while len(frontier) != 0:
+        node = frontier.pop()
 
         if problem.is_goal(node.state):
             return get_path(node)
 
-        for child in problem.expand(node):
-            s = child.state
+        if stats is not None:
+            stats.expanding(len(frontier) + 1, 0)
+
+        for action, s, cost in problem.successors(node.state):
+            if stats is not None:
+                stats.generated += 1
 
-            if problem.hashable_state(s) not in reached:
-                reached[problem.hashable_state(s)] = child
-                cost = problem.estimated_cost(s)
-                frontier.put((cost, entry, child))
-                entry += 1
+            key = problem.hashable_state(s)
+
+            if key not in reached:
+                reached.add(key)
+                child = Node(s, node, action, node.path_cost + cost, node.depth + 1)
+                frontier.push(key, problem.estimated_cost(s), child)
+            elif stats is not None:
+                stats.duplicates += 1
 
     return []
+
+
+def anytime_repairing_a_star(problem: Problem, weight: float = 3, weight_step: float = 0.5,
+                             time_limit: float = 1, frontier_type: type = HeapFrontier,
+                             stats: SearchStats = None) -> Iterator[Tuple[List[str], float]]:
+    """
+    Takes in a Problem object that has an initial and goal state as
+     well as search operators (metohds). Performs Anytime Repairing A*
+     (ARA*) and yields each better path found together with its
+     suboptimality bound: the path costs at most bound times the optimal
+     cost. Yields nothing if no path is found.
+     The first path comes from weighted A* with the starting weight. After
+     each path the weight is lowered by weight_step and the search goes on
+     from the nodes it already has. Each state is expanded at most once per
+     weight; states that get cheaper after their expansion are kept aside
+     and put back in the frontier when the weight changes. The search stops
+     once a path is known to be optimal (bound 1) or time_limit seconds have
+     passed. The time limit is only checked after the first path is found.
+     frontier_type is the Frontier class used to order the nodes.
+     stats is an optional SearchStats updated while searching.
+     """
+    if not problem.can_reach_goal():
+        return
+
+    deadline = time.perf_counter() + time_limit
+    node = Node(problem.initial)
+
+    if problem.is_goal(node.state):
+        yield get_path(node), 1
+        return
+
+    key = problem.hashable_state(node.state)
+    # cheapest node found so far for every reached state
+    reached = {key: node}
+    frontier = frontier_type()
+    frontier.push(key, weight * problem.estimated_cost(node.state), node)
+    # states expanded with the current weight
+    closed = problem.reached_set()
+    # closed states that got cheaper, searched again with the next weight
+    inconsistent = {}
+    goal = None
+    # cost and bound of the last path yielded
+    last = None
+
+    while True:
+        while len(frontier) != 0 and (goal is None or goal.path_cost > frontier.top_priority()):
+            if goal is not None and time.perf_counter() > deadline:
+                return
+
+            node = frontier.pop()
+            closed.add(problem.hashable_state(node.state))
+
+            children = problem.expand(node)
+            if stats is not None:
+                stats.expanding(len(frontier) + 1, len(children))
+
+            for child in children:
+                s = child.state
+                key = problem.hashable_state(s)
+                best = reached.get(key)
+
+                if best is None or child.path_cost < best.path_cost:
+                    reached[key] = child
+                    if problem.is_goal(s) and (goal is None or child.path_cost < goal.path_cost):
+                        goal = child
+                    if key in closed:
+                        inconsistent[key] = child
+                    else:
+                        frontier.push(key, weight * problem.estimated_cost(s) + child.path_cost, child)
+                elif stats is not None:
+                    stats.duplicates += 1
+
+        if goal is None:
+            return
+
+        # every state left to search costs at least its g + h, so the
+        # cheapest of those is a lower bound on the optimal cost
+        waiting = [n for k, n in frontier.items()] + list(inconsistent.values())
+        lowest = min((n.path_cost + problem.estimated_cost(n.state) for n in waiting), default=goal.path_cost)
+        bound = max(1, min(weight, goal.path_cost / lowest)) if lowest > 0 else 1
+        if last is None or (goal.path_cost, bound) < last:
+            last = (goal.path_cost, bound)
+            yield get_path(goal), bound
+
+        if bound <= 1 or time.perf_counter() > deadline:
+            return
+
+        # search again with a smaller weight, reusing the reached nodes
+        weight = max(1, weight - weight_step)
+        frontier = frontier_type()
+        for n in waiting:
+            frontier.push(problem.hashable_state(n.state), weight * problem.estimated_cost(n.state) + n.path_cost, n)
+        closed = problem.reached_set()
+        inconsistent = {}
+
+
+def iterative_deepening_a_star(problem: Problem, stats: SearchStats = None) -> Any:
+    """
+    Takes in a Problem object that has an initial and goal state as
+     well as search operators (metohds). Performs Iterative Deepening A*
+     and returns the path found. Returns and empty list is no path is found.
+     Each iteration is a depth first search that cuts off nodes whose
+     path cost plus estimated cost is above a bound. The next bound is the
+     smallest value that was cut off. Only the current path is kept, and
+     cycles are detected by checking the states on that path, so memory
+     grows with the depth of the solution instead of the size of the maze.
+     stats is an optional SearchStats updated while searching. The current
+     path is counted as the frontier.
+     """
+    if not problem.can_reach_goal():
+        return []
+
+    root = Node(problem.initial)
+    root_key = problem.hashable_state(root.state)
+    bound = problem.estimated_cost(root.state)
+
+    while True:
+        # smallest f value that was above the bound during this iteration
+        smallest = float('inf')
+
+        # each entry is [node, hashable state, iterator over the children]
+        stack = [[root, root_key, None]]
+        on_path = {root_key}
+
+        while len(stack) != 0:
+            entry = stack[-1]
+            node = entry[0]
+
+            if entry[2] is None:
+                f = node.path_cost + problem.estimated_cost(node.state)
+                if f > bound:
+                    smallest = min(smallest, f)
+                    stack.pop()
+                    on_path.discard(entry[1])
+                    continue
+
+                if problem.is_goal(node.state):
+                    return get_path(node)
+
+                children = problem.expand(node)
+                if stats is not None:
+                    stats.expanding(len(stack), len(children))
+                entry[2] = iter(children)
+
+            child = next(entry[2], None)
+            if child is None:
+                stack.pop()
+                on_path.discard(entry[1])
+                continue
+
+            key = problem.hashable_state(child.state)
+            if key not in on_path:
+                on_path.add(key)
+                stack.append([child, key, None])
+            elif stats is not None:
+                stats.duplicates += 1
+
+        if smallest == float('inf'):
+            return []
+        bound = smallest
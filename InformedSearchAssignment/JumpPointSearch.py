@@ -0,0 +1,151 @@
+from Problem import *
+from Frontier import *
+from SearchStats import SearchStats
+from InformedSearch import a_star
+
+_ACTION_NAMES = {d: a for a, d in DIRECTIONS.items()}
+
+
+def _padded_layout(problem: Problem) -> Tuple[List[List[bool]], Tuple[int, int], Tuple[int, int]]:
+    """
+    Returns which cells of the maze are open along with the start and goal
+    locations. The open cells are padded with a border of closed cells, so
+    the locations are shifted by one row and one column.
+    """
+    grid, start, goal = problem.maze_layout()
+    height, width = grid.shape
+    cells = [[False] * (width + 2)]
+    for row in (grid != 0).tolist():
+        cells.append([False] + row + [False])
+    cells.append([False] * (width + 2))
+    return cells, (start[0] + 1, start[1] + 1), (goal[0] + 1, goal[1] + 1)
+
+
+def _uniform_cost(problem: Problem) -> bool:
+    """true if stepping onto any open cell of the maze costs the same"""
+    costs = problem.costs
+    finite = costs[np.isfinite(costs)]
+    return finite.size == 0 or finite.min() == finite.max()
+
+
+def _jump(cells: List[List[bool]], row: int, col: int, d_row: int, d_col: int, goal: Tuple[int, int]) -> Any:
+    """
+    Moves from (row, col) in a straight line until reaching a jump point,
+    the goal, or a closed cell. A cell is a jump point when a path through
+    it can not be found more cheaply without it: a side opening appears
+    that was blocked one step back, or, for vertical moves, a horizontal
+    jump from the cell finds a jump point.
+    :return: (row, col) of the jump point or None if the line is a dead end
+    """
+    while cells[row][col]:
+        if (row, col) == goal:
+            return row, col
+
+        if d_col != 0:
+            # moving east or west
+            if (cells[row - 1][col] and not cells[row - 1][col - d_col]) or \
+                    (cells[row + 1][col] and not cells[row + 1][col - d_col]):
+                return row, col
+        else:
+            # moving north or south
+            if (cells[row][col - 1] and not cells[row - d_row][col - 1]) or \
+                    (cells[row][col + 1] and not cells[row - d_row][col + 1]):
+                return row, col
+            if _jump(cells, row, col + 1, 0, 1, goal) is not None or _jump(cells, row, col - 1, 0, -1, goal) is not None:
+                return row, col
+
+        row += d_row
+        col += d_col
+    return None
+
+
+def _neighbors(cells: List[List[bool]], node: Node) -> List[Tuple[int, int]]:
+    """
+    Returns the directions worth searching from the jump point in node.
+    Moving straight or turning is enough; going back the way the search
+    came is never part of a shorter path.
+    """
+    if node.action is None:
+        directions = DIRECTIONS.values()
+    else:
+        d_row, d_col = DIRECTIONS[node.action]
+        if d_col != 0:
+            directions = [(-1, 0), (0, d_col), (1, 0)]
+        else:
+            directions = [(0, 1), (d_row, 0), (0, -1)]
+
+    row, col = node.state
+    return [d for d in directions if cells[row + d[0]][col + d[1]]]
+
+
+def jump_point_search(problem: Problem, frontier_type: type = HeapFrontier, stats: SearchStats = None) -> Any:
+    """
+    Takes in a MazeNavigation or CoordinateMazeNavigation problem where
+     every move costs the same and performs A* over jump points. Instead of
+     adding every cell of a corridor to the frontier, the search jumps in a
+     straight line until it reaches a cell where the path could turn, so
+     far fewer nodes are expanded. Returns the same list of actions as
+     get_path, one per step, or an empty list if no path is found.
+     stats is an optional SearchStats updated while searching. Only jump
+     points are counted as nodes. Jumps skip the cells they cover, so a
+     maze with terrain cells is searched with a_star instead.
+     """
+    if not _uniform_cost(problem):
+        return a_star(problem, frontier_type, stats=stats)
+
+    cells, start, goal = _padded_layout(problem)
+
+    node = Node(start)
+    if start == goal:
+        return [None]
+
+    def estimated_cost(state):
+        return abs(state[0] - goal[0]) + abs(state[1] - goal[1])
+
+    frontier = frontier_type()
+    frontier.push(start, estimated_cost(start), node)
+    reached = {start: node}
+
+    while len(frontier) != 0:
+        node = frontier.pop()
+
+        if node.state == goal:
+            return _get_steps(node)
+
+        row, col = node.state
+        jump_points = []
+        for d_row, d_col in _neighbors(cells, node):
+            jump_point = _jump(cells, row + d_row, col + d_col, d_row, d_col, goal)
+            if jump_point is not None:
+                jump_points.append((jump_point, d_row, d_col))
+
+        if stats is not None:
+            stats.expanding(len(frontier) + 1, len(jump_points))
+
+        for jump_point, d_row, d_col in jump_points:
+            steps = abs(jump_point[0] - row) + abs(jump_point[1] - col)
+            child = Node(jump_point, node, _ACTION_NAMES[(d_row, d_col)], node.path_cost + steps, node.depth + 1)
+            best = reached.get(jump_point)
+
+            if best is None or child.path_cost < best.path_cost:
+                reached[jump_point] = child
+                frontier.push(jump_point, child.path_cost + estimated_cost(jump_point), child)
+            elif stats is not None:
+                stats.duplicates += 1
+
+    return []
+
+
+def _get_steps(node: Node) -> List[str]:
+    """
+    Takes in the Node of the goal jump point and returns the actions from
+    the start, repeating the action of each jump once for every cell it covers.
+    """
+    p = []
+    while node.parent is not None:
+        steps = abs(node.state[0] - node.parent.state[0]) + abs(node.state[1] - node.parent.state[1])
+        p.extend([node.action] * steps)
+        node = node.parent
+    p.append(None)
+    p.reverse()
+    return p
@@ -0,0 +1,188 @@
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict, deque
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+# most landmark heuristics kept by this process before the least recently
+# used one is dropped. Each holds its tables twice, as numpy arrays and as
+# python lists, so a large maze takes several bytes per cell per landmark
+LANDMARK_CACHE_SIZE = 2
+
+# landmark tables already loaded by this process, keyed by grid fingerprint
+_loaded: "OrderedDict[str, LandmarkHeuristic]" = OrderedDict()
+
+
+class LandmarkHeuristic:
+    """
+    ALT (A*, Landmarks, Triangle inequality) heuristic for a maze layout.
+    The distance from a few landmark cells to every cell is found once with
+    a breadth first search. By the triangle inequality the distance between
+    two cells is at least the difference of their distances to any landmark,
+    which is admissible and much tighter than Manhattan distance around walls.
+    """
+
+    def __init__(self, landmarks: List[Tuple[int, int]], distances: np.ndarray):
+        """
+        :param landmarks: (row, col) of every landmark
+        :param distances: array of shape (landmarks, rows, cols) with the distance
+        from each landmark to each cell, inf where the cell can not be reached
+        """
+        self._landmarks = landmarks
+        self._distances = distances
+        self._width = distances.shape[2]
+        # flat python lists are much faster to index than numpy arrays
+        self._flat = [d.ravel().tolist() for d in distances]
+
+    @property
+    def landmarks(self) -> List[Tuple[int, int]]:
+        """(row, col) of every landmark"""
+        return self._landmarks
+
+    @property
+    def distances(self) -> np.ndarray:
+        """distance from each landmark to each cell"""
+        return self._distances
+
+    def estimate(self, current: Tuple[int, int], goal: Tuple[int, int]) -> float:
+        """
+        Returns a lower bound on the distance between two cells
+        :param current: (row, col) of the current cell
+        :param goal: (row, col) of the goal cell
+        :return: largest landmark lower bound, 0 if no landmark reaches both cells
+        """
+        return self.to_goal(goal)(current)
+
+    def to_goal(self, goal: Tuple[int, int]) -> Callable[[Tuple[int, int]], float]:
+        """
+        Returns a function that estimates the distance from a cell to goal.
+        The landmark distances of the goal are looked up once, so repeated
+        calls during a search only index the current cell.
+        :param goal: (row, col) of the goal cell
+        :return: function that takes a (row, col) and returns the estimate
+        """
+        width = self._width
+        g = goal[0] * width + goal[1]
+        inf = float('inf')
+        tables = [(d, d[g]) for d in self._flat if d[g] != inf]
+
+        def estimate(current: Tuple[int, int]) -> float:
+            c = current[0] * width + current[1]
+            best = 0
+            for d, to_goal in tables:
+                diff = abs(to_goal - d[c])
+                if best < diff < inf:
+                    best = diff
+            return best
+
+        return estimate
+
+
+def _distance_map(open_cells: np.ndarray, source: Tuple[int, int]) -> np.ndarray:
+    """
+    Breadth first search from source over the open cells of a maze.
+    :return: array with the number of moves to each cell, inf if unreachable
+    """
+    height, width = open_cells.shape
+    cells = open_cells.tolist()
+    dist = [[float('inf')] * width for i in range(height)]
+    dist[source[0]][source[1]] = 0
+    frontier = deque([source])
+
+    while len(frontier) != 0:
+        row, col = frontier.popleft()
+        d = dist[row][col] + 1
+        for r, c in ((row - 1, col), (row, col + 1), (row + 1, col), (row, col - 1)):
+            if 0 <= r < height and 0 <= c < width and cells[r][c] and dist[r][c] > d:
+                dist[r][c] = d
+                frontier.append((r, c))
+
+    return np.array(dist)
+
+
+def select_landmarks(open_cells: np.ndarray, num_landmarks: int) -> Tuple[List[Tuple[int, int]], np.ndarray]:
+    """
+    Picks landmarks with farthest point selection. The first landmark is the
+    cell farthest from an arbitrary open cell and every next landmark is the
+    cell farthest from all landmarks picked so far, which spreads them
+    around the edges of the maze where they give the best estimates.
+    :param open_cells: boolean array, true where the maze can be walked on
+    :param num_landmarks: number of landmarks to pick
+    :return: landmarks and their distance maps
+    """
+    where = np.argwhere(open_cells)
+    if len(where) == 0:
+        return [], np.zeros((0,) + open_cells.shape)
+
+    # closest distance from every cell to any landmark picked so far
+    closest = _distance_map(open_cells, (int(where[0][0]), int(where[0][1])))
+    landmarks = []
+    maps = []
+    for i in range(num_landmarks):
+        reachable = np.where(np.isinf(closest), -1, closest)
+        row, col = np.unravel_index(int(np.argmax(reachable)), reachable.shape)
+        if i > 0 and reachable[row, col] <= 0:
+            # every reachable cell already is a landmark
+            break
+        landmarks.append((int(row), int(col)))
+        maps.append(_distance_map(open_cells, landmarks[-1]))
+        closest = maps[-1] if i == 0 else np.minimum(closest, maps[-1])
+
+    return landmarks, np.array(maps)
+
+
+def layout_fingerprint(open_cells: np.ndarray) -> str:
+    """
+    Returns a string that identifies a maze layout, used to cache
+    tables that only depend on which cells are open
+    :param open_cells: boolean array, true where the maze can be walked on
+    :return: hex digest of the layout
+    """
+    return hashlib.sha1(np.packbits(open_cells).tobytes() + repr(open_cells.shape).encode()).hexdigest()
+
+
+def load_landmarks(grid: np.ndarray, num_landmarks: int = 8, cache_dir: str = None) -> LandmarkHeuristic:
+    """
+    Returns the landmark heuristic for a maze layout. Tables are built once
+    per layout and the most recent ones are kept in memory. With a cache_dir
+    they are also saved to disk, so later searches on the same maze in
+    another process or run reuse them.
+    :param grid: maze as a 2D numpy array, 0s are impassable
+    :param num_landmarks: number of landmarks to pick
+    :param cache_dir: folder to save the tables to, None to only cache in memory
+    :return: LandmarkHeuristic for the maze
+    """
+    open_cells = grid != 0
+    key = f"{layout_fingerprint(open_cells)}_{num_landmarks}"
+
+    if key in _loaded:
+        _loaded.move_to_end(key)
+        return _loaded[key]
+
+    filename = None if cache_dir is None else os.path.join(cache_dir, key + ".npz")
+    if filename is not None and os.path.exists(filename):
+        with np.load(filename) as data:
+            heuristic = LandmarkHeuristic([tuple(int(v) for v in l) for l in data["landmarks"]], data["distances"])
+    else:
+        landmarks, distances = select_landmarks(open_cells, num_landmarks)
+        heuristic = LandmarkHeuristic(landmarks, distances)
+        if filename is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            # written to a temporary file and moved into place, so another
+            # process never loads a half written file
+            fd, temp = tempfile.mkstemp(suffix=".npz", dir=cache_dir)
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    np.savez_compressed(file, landmarks=np.array(landmarks, dtype=int).reshape(-1, 2),
+                                        distances=distances)
+                os.replace(temp, filename)
+            except BaseException:
+                os.remove(temp)
+                raise
+
+    _loaded[key] = heuristic
+    if len(_loaded) > LANDMARK_CACHE_SIZE:
+        _loaded.popitem(last=False)
+    return heuristic
@@ -0,0 +1,237 @@
+import numpy as np
+
+# maze kinds the generator can build, used as the first part of a maze ID
+KINDS = ["backtracker", "obstacles", "rooms", "terrain"]
+
+# share of cells that are walls in an obstacles maze
+OBSTACLE_DENSITY = 0.3
+# number of open cells along each side of a room
+ROOM_SIZE = 9
+# chance that a wall between two rooms gets a door after the rooms are connected
+EXTRA_DOORS = 0.2
+# share of the cells that are rough terrain in a terrain maze
+ROUGH_TERRAIN = 0.3
+
+# random numbers drawn at a time while carving a backtracker maze
+RANDOM_BLOCK = 1 << 16
+
+
+def maze_id(kind: str, size: int, seed: int) -> str:
+    """
+    Returns the ID of a generated maze, for example "backtracker-1000-s7".
+    The same ID always generates the same maze.
+    :param kind: one of KINDS
+    :param size: number of rows and columns
+    :param seed: seed of the random number generator
+    :return: maze ID
+    """
+    return f"{kind}-{size}-s{seed}"
+
+
+def parse_maze_id(name: str):
+    """
+    Splits a maze ID made by maze_id into its parts
+    :param name: maze ID
+    :return: kind, size and seed
+    """
+    parts = name.split("-")
+    if len(parts) != 3 or parts[0] not in KINDS or not parts[2].startswith("s"):
+        raise ValueError(f"Invalid maze ID: {name}")
+    return parts[0], int(parts[1]), int(parts[2][1:])
+
+
+def generate_maze(name: str):
+    """
+    Builds the maze with the given ID
+    :param name: maze ID made by maze_id
+    :return: initial and goal states as a tuple. 0s are impassable,
+    1s are walkable, -1s are walkable at a higher cost, and 2s represent
+    location of the agent
+    """
+    kind, size, seed = parse_maze_id(name)
+    if kind == "backtracker":
+        return backtracker_maze(size, seed)
+    elif kind == "obstacles":
+        return obstacle_maze(size, seed)
+    elif kind == "rooms":
+        return rooms_maze(size, seed)
+    return terrain_maze(size, seed)
+
+
+def _place_agent(grid: np.ndarray, start_loc, end_loc):
+    """
+    Returns the initial and goal states with the agent at start_loc
+    and end_loc of the layout in grid. grid itself becomes the goal state,
+    so a big maze is not copied twice
+    """
+    initial_state = np.copy(grid)
+    goal_state = grid
+
+    initial_state[start_loc[0]][start_loc[1]] = 2
+    goal_state[end_loc[0]][end_loc[1]] = 2
+
+    return [initial_state, goal_state]
+
+
+def _carve_tree(rows: int, cols: int, rng: np.random.Generator):
+    """
+    Builds a random spanning tree over a rows x cols grid of cells with an
+    iterative recursive backtracker: walk to a random unvisited neighbor
+    and back up when there is none.
+    :return: generator of the (cell, neighbor) pairs joined by the tree,
+    cells are numbered row * cols + col. The pairs are not kept, so a big
+    maze can be carved as they come
+    """
+    visited = bytearray(rows * cols)
+    visited[0] = 1
+    stack = [0]
+    # random numbers are drawn in fixed size blocks, one per step is much
+    # slower and one block for the whole maze takes too much memory. Two
+    # numbers per cell are drawn in total, used or not, so the numbers the
+    # caller draws afterwards, and so the mazes, do not depend on the block size
+    choices = []
+    step = 0
+    budget = rows * cols * 2
+
+    while len(stack) != 0:
+        cell = stack[-1]
+        row, col = divmod(cell, cols)
+        options = []
+        if row > 0 and not visited[cell - cols]:
+            options.append(cell - cols)
+        if col < cols - 1 and not visited[cell + 1]:
+            options.append(cell + 1)
+        if row < rows - 1 and not visited[cell + cols]:
+            options.append(cell + cols)
+        if col > 0 and not visited[cell - 1]:
+            options.append(cell - 1)
+
+        if len(options) == 0:
+            stack.pop()
+            continue
+
+        if step == len(choices):
+            choices = rng.random(min(RANDOM_BLOCK, budget)).tolist()
+            budget -= len(choices)
+            step = 0
+        neighbor = options[int(choices[step] * len(options))]
+        step += 1
+
+        visited[neighbor] = 1
+        yield cell, neighbor
+        stack.append(neighbor)
+
+    while budget > 0:
+        budget -= len(rng.random(min(RANDOM_BLOCK, budget)))
+
+
+def backtracker_maze(size: int, seed: int):
+    """
+    Perfect maze, with exactly one path between any two open cells, made
+    with a recursive backtracker. Cells sit on even rows and columns and
+    the walls between them are knocked out along a random spanning tree.
+    The agent starts in the upper left and the goal is in the lower right.
+    :return: initial and goal states as a tuple. 0s are impassable,
+    1s are walkable, and 2s represent location of the agent
+    """
+    rng = np.random.default_rng(seed)
+    rows = cols = (size + 1) // 2
+    grid = np.zeros((size, size))
+    grid[::2, ::2][:rows, :cols] = 1
+
+    for cell, neighbor in _carve_tree(rows, cols, rng):
+        r1, c1 = divmod(cell, cols)
+        r2, c2 = divmod(neighbor, cols)
+        grid[r1 + r2][c1 + c2] = 1
+
+    return _place_agent(grid, [0, 0], [2 * (rows - 1), 2 * (cols - 1)])
+
+
+def obstacle_maze(size: int, seed: int, density: float = OBSTACLE_DENSITY):
+    """
+    Open maze where each cell is a wall with probability density. The
+    goal is not guaranteed to be reachable.
+    The agent starts in the upper left and the goal is in the lower right.
+    :return: initial and goal states as a tuple. 0s are impassable,
+    1s are walkable, and 2s represent location of the agent
+    """
+    rng = np.random.default_rng(seed)
+    grid = (rng.random((size, size)) >= density).astype(float)
+    grid[0][0] = 1
+    grid[size - 1][size - 1] = 1
+
+    return _place_agent(grid, [0, 0], [size - 1, size - 1])
+
+
+def rooms_maze(size: int, seed: int, room_size: int = ROOM_SIZE, extra_doors: float = EXTRA_DOORS):
+    """
+    Square rooms separated by walls one cell thick. The rooms are joined
+    by doors along a random spanning tree so every room can be reached, and
+    some more walls get a door so there is more than one route.
+    The agent starts in the upper left room and the goal is in the lower right.
+    :return: initial and goal states as a tuple. 0s are impassable,
+    1s are walkable, and 2s represent location of the agent
+    """
+    rng = np.random.default_rng(seed)
+    step = room_size + 1
+    rooms = max(1, (size + 1) // step)
+    grid = np.zeros((size, size))
+    for i in range(rooms):
+        for j in range(rooms):
+            grid[i * step:i * step + room_size, j * step:j * step + room_size] = 1
+
+    walls = set(_carve_tree(rooms, rooms, rng))
+    for cell in range(rooms * rooms):
+        for neighbor in (cell + 1, cell + rooms):
+            if (neighbor == cell + 1 and neighbor % rooms == 0) or neighbor >= rooms * rooms:
+                continue
+            if (cell, neighbor) not in walls and (neighbor, cell) not in walls and rng.random() < extra_doors:
+                walls.add((cell, neighbor))
+
+    for cell, neighbor in walls:
+        first = min(cell, neighbor)
+        row, col = divmod(first, rooms)
+        offset = int(rng.integers(room_size))
+        if abs(neighbor - cell) == 1:
+            # door in the wall to the east of the room
+            grid[row * step + offset][col * step + room_size] = 1
+        else:
+            # door in the wall to the south of the room
+            grid[row * step + room_size][col * step + offset] = 1
+
+    last = (rooms - 1) * step + min(room_size, size) - 1
+    return _place_agent(grid, [0, 0], [last, last])
+
+
+def _smooth(values: np.ndarray, radius: int) -> np.ndarray:
+    """
+    Averages every cell with the cells up to radius away in each
+    direction, using cumulative sums so the cost does not depend on radius
+    """
+    width = 2 * radius + 1
+    padded = np.pad(values, radius, mode="edge")
+    sums = np.cumsum(np.cumsum(padded, axis=0), axis=1)
+    sums = np.pad(sums, ((1, 0), (1, 0)))
+    box = sums[width:, width:] - sums[:-width, width:] - sums[width:, :-width] + sums[:-width, :-width]
+    return box / (width * width)
+
+
+def terrain_maze(size: int, seed: int, rough: float = ROUGH_TERRAIN, density: float = OBSTACLE_DENSITY / 3):
+    """
+    Mostly open maze with patches of rough terrain (-1 cells) that cost
+    more to walk through, and a few scattered walls. The patches come from
+    smoothed random noise, so they form blobs that are cheaper to walk
+    around than through.
+    The agent starts in the upper left and the goal is in the lower right.
+    :return: initial and goal states as a tuple. 0s are impassable,
+    1s are walkable, -1s are walkable at a higher cost, and 2s represent
+    location of the agent
+    """
+    rng = np.random.default_rng(seed)
+    noise = _smooth(rng.random((size, size)), max(1, size // 50))
+    grid = np.where(noise >= np.quantile(noise, 1 - rough), -1.0, 1.0)
+    grid[rng.random((size, size)) < density] = 0
+    grid[0][0] = 1
+    grid[size - 1][size - 1] = 1
+
+    return _place_agent(grid, [0, 0], [size - 1, size - 1])
@@ -0,0 +1,113 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Tuple
+
+from Problem import *
+from InformedSearch import a_star
+from Landmarks import load_landmarks
+from Reachability import load_components
+
+# service used by the worker processes of MazePathService.find_paths
+_worker_service = None
+
+
+class MazePathService:
+    """
+    Answers many (start, goal) path queries on one maze layout. The layout,
+    the connected components and the landmark tables are built once and
+    shared by every query; successors are still generated from the grid by
+    each search. Queries between cells in different components are answered
+    without searching.
+    """
+
+    def __init__(self, grid: np.ndarray, num_landmarks: int = 8, search: Callable[[Problem], Any] = a_star,
+                 cache_dir: str = None):
+        """
+        :param grid: maze as a 2D numpy array. 0s are impassable, a 2 marking
+        an agent is treated as walkable
+        :param num_landmarks: number of landmarks for the heuristic, 0 for
+        plain Manhattan distance
+        :param search: search function called with each query's problem
+        :param cache_dir: folder to save the landmark tables to, so worker
+        processes load them instead of building them again. None to build
+        them in every process
+        """
+        self._grid = np.where(grid == 2, 1, grid)
+        self._num_landmarks = num_landmarks
+        self._search = search
+        self._cache_dir = cache_dir
+        self._components = load_components(self._grid)
+        landmarks = load_landmarks(self._grid, num_landmarks, cache_dir) if num_landmarks > 0 else None
+
+        # any open cell works as the endpoints of the template problem,
+        # every query replaces them with with_endpoints. The agent hides the
+        # value of its cell, so the costs come from the grid itself
+        initial_state = np.copy(self._grid)
+        open_cells = np.argwhere(self._grid != 0)
+        if len(open_cells) != 0:
+            initial_state[tuple(open_cells[0])] = 2
+            self._template = CoordinateMazeNavigation(initial_state, initial_state, landmarks, cost_grid(self._grid))
+            self._template._components = self._components
+        else:
+            self._template = None
+
+    @property
+    def grid(self) -> np.ndarray:
+        """maze layout the queries are answered on"""
+        return self._grid
+
+    def _check_cell(self, cell: Tuple[int, int]):
+        """raises ValueError if cell is not on the grid"""
+        height, width = self._grid.shape
+        if not (0 <= cell[0] < height and 0 <= cell[1] < width):
+            raise ValueError(f"cell {tuple(cell)} is outside the {height}x{width} maze")
+
+    def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[str]:
+        """
+        Returns the path between two cells in the same format as get_path
+        :param start: (row, col) where the agent starts
+        :param goal: (row, col) where the agent should end
+        :return: list of actions, or an empty list if there is no path
+        """
+        self._check_cell(start)
+        self._check_cell(goal)
+        if not self._components.connected(start, goal):
+            return []
+        return self._search(self._template.with_endpoints(start, goal))
+
+    def find_paths(self, queries: Iterable[Tuple[Tuple[int, int], Tuple[int, int]]],
+                   processes: int = None) -> List[List[str]]:
+        """
+        Returns the path for every (start, goal) pair, in the same order
+        :param queries: (start, goal) pairs of (row, col) locations
+        :param processes: number of worker processes. None or 1 answers the
+        queries in this process
+        :return: list with one path per query
+        """
+        queries = list(queries)
+        for start, goal in queries:
+            self._check_cell(start)
+            self._check_cell(goal)
+        if processes is None or processes <= 1 or len(queries) <= 1:
+            return [self.find_path(start, goal) for start, goal in queries]
+
+        # unreachable pairs are answered here instead of being sent to a worker
+        paths = [[] for i in range(len(queries))]
+        todo = [i for i, (start, goal) in enumerate(queries) if self._components.connected(start, goal)]
+
+        with ProcessPoolExecutor(processes, initializer=_start_worker,
+                                 initargs=(self._grid, self._num_landmarks, self._search, self._cache_dir)) as executor:
+            chunk = max(1, len(todo) // (processes * 4))
+            for i, path in zip(todo, executor.map(_worker_path, [queries[i] for i in todo], chunksize=chunk)):
+                paths[i] = path
+        return paths
+
+
+def _start_worker(grid: np.ndarray, num_landmarks: int, search: Callable[[Problem], Any], cache_dir: str) -> None:
+    """Builds the service once in each worker process"""
+    global _worker_service
+    _worker_service = MazePathService(grid, num_landmarks, search, cache_dir)
+
+
+def _worker_path(query: Tuple[Tuple[int, int], Tuple[int, int]]) -> List[str]:
+    """Answers one query in a worker process"""
+    return _worker_service.find_path(query[0], query[1])
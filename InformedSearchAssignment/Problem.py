@@ -1,14 +1,37 @@
 from __future__ import annotations  # needed in order to reference a Class within itself
 
-from typing import List, Any, Generic, TypeVar
+from typing import List, Any, Generic, Iterator, TypeVar, Tuple
 from abc import ABC, abstractmethod
+import weakref
+from copy import copy
 import numpy as np
 
+from Landmarks import LandmarkHeuristic
+from Reachability import load_components
+from ReachedSet import BitSet
+
 # https://realpython.com/python-type-checking/
 T = TypeVar('T')
 
+# cost of stepping onto a -1 (rough terrain) cell, walkable cells cost 1
+TERRAIN_COST = 3
+
+
+def cost_grid(grid: np.ndarray, terrain_cost: float = TERRAIN_COST) -> np.ndarray:
+    """
+    Returns the cost of stepping onto every cell of a maze
+    :param grid: maze as a 2D numpy array. 0s are impassable, -1s are
+    rough terrain and every other value is walkable
+    :param terrain_cost: cost of stepping onto a -1 cell
+    :return: array of the same shape, inf for impassable cells
+    """
+    return np.where(grid == 0, np.inf, np.where(grid == -1, float(terrain_cost), 1.0))
+
 
 class Node(Generic[T]):
+    # fixed attributes instead of a __dict__ make every node much smaller,
+    # which matters when a search creates millions of them
+    __slots__ = ("_state", "_parent", "_action", "_path_cost", "_id", "_depth")
     count = 0
 
     def __init__(self, state: T, parent: Node = None, action: str = None, path_cost: float = 0, depth: int = 0):
@@ -104,6 +127,17 @@ class Problem(ABC, Generic[T]):
         """
         pass
 
+    def successors(self, state: T) -> Iterator[Tuple[str, T, float]]:
+        """
+        Yields the neighboring states of state one at a time, so a search
+        can skip the ones it already reached before making a Node for them.
+        :param state: current state
+        :return: iterator of (action, next state, action cost)
+        """
+        for a in self._actions(state):
+            next_state = self._result(state, a)
+            yield a, next_state, self._action_cost(state, a, next_state)
+
     @abstractmethod
     def _actions(self, state: Any) -> List[str]:
         """
@@ -157,6 +191,70 @@ class Problem(ABC, Generic[T]):
         """
         pass
 
+    def reached_set(self) -> Any:
+        """
+        Returns an empty set for hashable_state values, used by the searches
+        that only need to know whether a state was reached. Problems whose
+        states are numbered can return a more compact set.
+        :return: object with add, in and len like a set
+        """
+        return set()
+
+    def can_reach_goal(self) -> bool:
+        """
+        Returns false if the goal is known to be unreachable from the
+        initial state, so searches can return without exploring. Problems
+        that can not tell cheaply return true.
+        :return: false if there is no path to the goal
+        """
+        return True
+
+    def reverse(self) -> Problem:
+        """
+        Returns the problem that searches from the goal back to the
+        initial state. Needed by the bidirectional searches. The states
+        of both problems must share the same hashable_state values.
+        :return: Problem whose initial state is this problem's goal
+        """
+        raise NotImplementedError(f"{type(self).__name__} can not be searched backwards")
+
+    def reverse_action(self, action: str) -> str:
+        """
+        Returns the action that undoes the passed in action. Used to turn
+        the path found by the reverse problem into actions of this problem
+        :param action: String that represents an action
+        :return: String that represents the opposite action
+        """
+        raise NotImplementedError(f"{type(self).__name__} can not be searched backwards")
+
+    def path_cost(self, path: List[str]) -> float:
+        """
+        Returns the cost of following a path from the initial state
+        :param path: actions as returned by the searches, a leading None
+        for the root is skipped
+        :return: sum of the action costs along the path
+        """
+        state = self.initial
+        total = 0
+        for action in path:
+            if action is None:
+                continue
+            next_state = self._result(state, action)
+            total += self._action_cost(state, action, next_state)
+            state = next_state
+        return total
+
+
+# (row, col) change of each of the maze actions, in the order the maze
+# problems try them
+DIRECTIONS = {"north": (-1, 0), "east": (0, 1), "south": (1, 0), "west": (0, -1)}
+
+# the maze actions in the order the maze problems try them
+ACTIONS = list(DIRECTIONS)
+
+# action that undoes each of the maze actions
+OPPOSITE_ACTIONS = {"north": "south", "east": "west", "south": "north", "west": "east"}
+
 
 class MazeNavigation(Problem[np.ndarray]):
     """
@@ -165,12 +263,17 @@ class MazeNavigation(Problem[np.ndarray]):
     are built to manipulate a numpy 2D array which is the state
     representation.
     """
-    def __init__(self, initial_state: T, goal_state: T):
+    def __init__(self, initial_state: T, goal_state: T, landmarks: LandmarkHeuristic = None,
+                 costs: np.ndarray = None):
         """
         Initializes a MazeNavigation type search problem. The
         state objects are 2D numpy arrays
         :param initial_state: Initial state of the problem
         :param goal_state:  Goal state of the problem
+        :param landmarks: optional landmark tables for this maze layout that
+        tighten the Manhattan distance used by estimated_cost
+        :param costs: optional cost of stepping onto each cell, defaults to
+        cost_grid of the initial state
         """
         super().__init__(initial_state, goal_state)
         # what each of the numbers in the maze means
@@ -178,13 +281,74 @@ class MazeNavigation(Problem[np.ndarray]):
         self._walkable = 1
         self._impassable = 0
 
+        # location of the agent in each state, keyed by the id of the state
+        # array. Locations are recorded as states are created, so the grid
+        # does not have to be scanned with np.where on every operator call
+        self._locations = {}
+        self._goal_location = self._location(goal_state)
+        self._height, self._width = initial_state.shape
+
+        # layout of the maze without the agent, used to put back the cell
+        # the agent leaves. The goal state shows what is under the start
+        start_row, start_col = self._location(initial_state)
+        self._layout = initial_state.tolist()
+        self._layout[start_row][start_col] = goal_state[start_row][start_col]
+
+        self._landmarks = landmarks
+        self._landmark_estimate = None if landmarks is None else landmarks.to_goal(self._goal_location)
+
+        self._cost_grid = cost_grid(np.array(self._layout)) if costs is None else costs
+        # nested lists index much faster than numpy arrays from python
+        self._costs = self._cost_grid.tolist()
+        finite = self._cost_grid[np.isfinite(self._cost_grid)]
+        # the heuristics count steps, so they are scaled by the cheapest
+        # cell to stay admissible
+        self._min_cost = float(finite.min()) if finite.size != 0 else 1.0
+        # the reverse problem pays for the cell it leaves instead of the one
+        # it steps onto, so a path costs the same searched from either end
+        self._reversed = False
+        # ComponentIndex of the maze, built by the first can_reach_goal
+        self._components = None
+
+    @property
+    def costs(self) -> np.ndarray:
+        """cost of stepping onto each cell, inf for impassable cells"""
+        return self._cost_grid
+
+    def _location(self, state: T) -> Tuple[int, int]:
+        """
+        Returns the (row, col) location of the agent in the passed in state.
+        The grid is only scanned for states that were not created by this problem
+        :param state: state to find the agent in
+        :return: row and col of the agent
+        """
+        entry = self._locations.get(id(state))
+        if entry is None:
+            where = np.where(state == self._character)
+            return self._remember(state, (int(where[0][0]), int(where[1][0])))
+        return entry[0]
+
+    def _remember(self, state: T, location: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Records the location of the agent in a state. The entry is removed
+        when the state is garbage collected so ids can not be confused
+        :param state: state the agent is in
+        :param location: row and col of the agent
+        :return: location that was recorded
+        """
+        key = id(state)
+        locations = self._locations
+        locations[key] = (location, weakref.ref(state, lambda ref: locations.pop(key, None)))
+        return location
+
     def is_goal(self, current: T) -> bool:
         """
         Returns true if the passed in state equals the goal state
         :param state: state to test
         :return: true or false if state equals goal
         """
-        return np.array_equal(current, self.goal)
+        # only compare the whole grid when the agent is in the right spot
+        return self._location(current) == self._goal_location and np.array_equal(current, self.goal)
 
     def expand(self, node: Node) -> List[Node]:
         """
@@ -214,8 +378,7 @@ class MazeNavigation(Problem[np.ndarray]):
         height, width = state.shape
 
         # gets our current location within the maze
-        row = np.where(state == self._character)[0][0]
-        col = np.where(state == self._character)[1][0]
+        row, col = self._location(state)
 
         # checks to see if there is a walkable space
         # in the four cardinal direction
@@ -245,21 +408,22 @@ class MazeNavigation(Problem[np.ndarray]):
 
         ret = np.copy(state)
         # gets our current location within the maze
-        row = np.where(state == self._character)[0][0]
-        col = np.where(state == self._character)[1][0]
+        row, col = self._location(state)
 
-        # move from the current location
-        ret[row][col] = self._walkable
+        # move from the current location, -1 tiles stay -1
+        ret[row][col] = self._layout[row][col]
 
         # move to the new location
         if action == "north":
-            ret[row - 1][col] = self._character
+            row -= 1
         elif action == "east":
-            ret[row][col + 1] = self._character
+            col += 1
         elif action == "south":
-            ret[row + 1][col] = self._character
+            row += 1
         elif action == "west":
-            ret[row][col - 1] = self._character
+            col -= 1
+        ret[row][col] = self._character
+        self._remember(ret, (row, col))
         return ret
 
     def _action_cost(self, curr_state: T, action: str, next_state: T) -> float:
@@ -272,17 +436,16 @@ class MazeNavigation(Problem[np.ndarray]):
         :return:
         """
 
-        # where we are about to step to
-        next_row = np.where(next_state == self._character)[0][0]
-        next_col = np.where(next_state == self._character)[1][0]
+        if self._reversed:
+            # where we are stepping from
+            row, col = self._location(curr_state)
+        else:
+            # where we are about to step to
+            row, col = self._location(next_state)
 
-        # right now the cost for all the walkable tiles is just 1
-        # can be modified to add cost for different types of tiles
-        # to simulate difficult terrain
-        if curr_state[next_row][next_col] == -1:
-            return 1
-        elif curr_state[next_row][next_col] == self._walkable:
-            return 1
+        # walkable tiles cost 1 and -1 tiles are difficult terrain,
+        # unless a different cost grid was passed in
+        return self._costs[row][col]
 
     def hashable_state(self, state: T) -> Any:
         """
@@ -292,11 +455,19 @@ class MazeNavigation(Problem[np.ndarray]):
         :param state: State object that needs to be hashed
         :return: object that can be hashed
         """
-        # For the maze navigation, state is a numpy array
-        # numpy arrays do not have a hash method, but we can
-        # use the value returns by tobytes as a unique representation
-        # of the array
-        return state.tobytes()
+        # For the maze navigation, state is a numpy array. Every state has
+        # the same layout and only the agent moves, so the number of the
+        # agent's cell identifies the state. It is the same number as in
+        # CoordinateMazeNavigation and much smaller than state.tobytes()
+        row, col = self._location(state)
+        return row * self._width + col
+
+    def reached_set(self) -> BitSet:
+        """
+        Returns an empty set for hashable_state values with one bit per cell
+        :return: BitSet with room for every cell of the maze
+        """
+        return BitSet(self._height * self._width)
 
     def estimated_cost(self, current: T):
         """
@@ -306,14 +477,304 @@ class MazeNavigation(Problem[np.ndarray]):
         """
 
         # row and col of current location
-        curr_row = np.where(current == self._character)[0][0]
-        curr_col = np.where(current == self._character)[1][0]
-
-        # row and col of goal location
-        goal_row = np.where(self.goal == self._character)[0][0]
-        goal_col = np.where(self.goal == self._character)[1][0]
+        curr_row, curr_col = self._location(current)
 
+        # row and col of goal location, found once at construction
+        goal_row, goal_col = self._goal_location
 
         # returns manhathan distance between current and goal
-        return abs(curr_row-goal_row) + abs(curr_col - goal_col)
+        manhattan = abs(curr_row-goal_row) + abs(curr_col - goal_col)
+        if self._landmark_estimate is None:
+            return manhattan * self._min_cost
+        # both are lower bounds, so the larger one is still admissible
+        return max(manhattan, self._landmark_estimate((curr_row, curr_col))) * self._min_cost
+
+    def maze_layout(self) -> Tuple[np.ndarray, Tuple[int, int], Tuple[int, int]]:
+        """
+        Returns the maze without the agent along with the start and goal
+        locations. Used by searches that work on the grid directly.
+        :return: maze as a 2D numpy array, (row, col) of the start and of the goal
+        """
+        start = self._location(self.initial)
+        grid = np.copy(self.initial)
+        grid[start] = self._walkable
+        return grid, start, self._goal_location
+
+    def can_reach_goal(self) -> bool:
+        """
+        Returns false if the agent and the goal are in different connected
+        components of the maze. The components are labeled once per maze
+        layout and kept by the problem, so later checks, and the problems
+        made by reverse, only compare two labels.
+        :return: false if there is no path to the goal
+        """
+        if self._components is None:
+            self._components = load_components(self.initial)
+        return self._components.connected(self._location(self.initial), self._goal_location)
+
+    def reverse(self) -> Problem:
+        """
+        Returns the problem that searches from the goal back to the
+        initial state. Moves in the maze can always be undone, so this
+        is the same maze with the initial and goal states swapped
+        :return: MazeNavigation from the goal to the initial state
+        """
+        ret = MazeNavigation(self.goal, self.initial, self._landmarks, self._cost_grid)
+        ret._reversed = not self._reversed
+        ret._components = self._components
+        return ret
+
+    def reverse_action(self, action: str) -> str:
+        """
+        Returns the action that undoes the passed in action
+        :param action: String that represents an action
+        :return: String that represents the opposite action
+        """
+        return OPPOSITE_ACTIONS[action]
+
+
+class CoordinateMazeNavigation(Problem[Tuple[int, int]]):
+    """
+    Maze Navigation Search problem where the maze layout is stored once
+    and the state is only the (row, col) location of the agent. Takes the
+    same 2D numpy arrays as MazeNavigation, but every search operator
+    runs in constant time instead of copying and scanning the whole grid.
+    """
+    def __init__(self, initial_state: np.ndarray, goal_state: np.ndarray, landmarks: LandmarkHeuristic = None,
+                 costs: np.ndarray = None):
+        """
+        Initializes a CoordinateMazeNavigation type search problem. The
+        maze layout is taken from the initial state and the state objects
+        are (row, col) tuples
+        :param initial_state: Initial maze with a 2 where the agent starts
+        :param goal_state:  Goal maze with a 2 where the agent should end
+        :param landmarks: optional landmark tables for this maze layout that
+        tighten the Manhattan distance used by estimated_cost
+        :param costs: optional cost of stepping onto each cell, defaults to
+        cost_grid of the maze layout
+        """
+        # what each of the numbers in the maze means
+        self._character = 2
+        self._walkable = 1
+        self._impassable = 0
+
+        start = np.where(initial_state == self._character)
+        goal = np.where(goal_state == self._character)
+        super().__init__((int(start[0][0]), int(start[1][0])), (int(goal[0][0]), int(goal[1][0])))
+
+        # static layout of the maze. The agent is not part of the layout.
+        # Like MazeNavigation, the goal state shows what is under the start,
+        # unless the agent is there too, then the cell is stored as walkable
+        self._grid = np.copy(initial_state)
+        under_start = goal_state[self.initial]
+        self._grid[self.initial] = self._walkable if under_start == self._character else under_start
+        self._height, self._width = self._grid.shape
+
+        # nested lists index much faster than numpy arrays from python
+        self._cells = self._grid.tolist()
+
+        self._landmarks = landmarks
+        self._landmark_estimate = None if landmarks is None else landmarks.to_goal(self.goal)
+
+        self._cost_grid = cost_grid(self._grid) if costs is None else costs
+        self._costs = self._cost_grid.tolist()
+        finite = self._cost_grid[np.isfinite(self._cost_grid)]
+        # the heuristics count steps, so they are scaled by the cheapest cell
+        self._min_cost = float(finite.min()) if finite.size != 0 else 1.0
+        # same as MazeNavigation, the reverse problem pays for the cell it leaves
+        self._reversed = False
+        # ComponentIndex of the maze, built by the first can_reach_goal
+        self._components = None
+
+    @property
+    def grid(self) -> np.ndarray:
+        """static layout of the maze without the agent"""
+        return self._grid
+
+    @property
+    def costs(self) -> np.ndarray:
+        """cost of stepping onto each cell, inf for impassable cells"""
+        return self._cost_grid
+
+    def is_goal(self, current: Tuple[int, int]) -> bool:
+        """
+        Returns true if the passed in state equals the goal state
+        :param state: state to test
+        :return: true or false if state equals goal
+        """
+        return current == self.goal
+
+    def expand(self, node: Node) -> List[Node]:
+        """
+        Creates a new list of Node objects for all the
+        neighboring states of the state in node.
+        :param node: Node object that represents a state
+        :return: List of Node objects
+        """
+        current_state = node.state
+        ret = []
+        for a in self._actions(current_state):
+            next_state = self._result(current_state, a)
+            cost = self._action_cost(current_state, a, next_state)
+            ret.append(Node(next_state, node, a, node.path_cost + cost, node.depth + 1))
+        return ret
+
+    def successors(self, state: Tuple[int, int]) -> Iterator[Tuple[str, Tuple[int, int], float]]:
+        """
+        Yields the neighboring states of state one at a time, checking the
+        four moves inline instead of through _actions and _result
+        :param state: current state
+        :return: iterator of (action, next state, action cost)
+        """
+        row, col = state
+        cells = self._cells
+        costs = self._costs
+        for action, r, c in (("north", row - 1, col), ("east", row, col + 1),
+                             ("south", row + 1, col), ("west", row, col - 1)):
+            if 0 <= r < self._height and 0 <= c < self._width and cells[r][c] != self._impassable:
+                # same costs as _action_cost
+                yield action, (r, c), costs[row][col] if self._reversed else costs[r][c]
+
+    def _actions(self, state: Tuple[int, int]) -> List[str]:
+        """
+        Returns a list of actions available for the given state.
+        :param state: current state
+        :return: List of actions encoded as Strings
+        """
+        ret = []
+        row, col = state
+        cells = self._cells
+
+        # checks to see if there is a walkable space
+        # in the four cardinal direction
+        # North
+        if row - 1 >= 0 and cells[row - 1][col] != self._impassable:
+            ret.append("north")
+        # East
+        if col + 1 < self._width and cells[row][col + 1] != self._impassable:
+            ret.append("east")
+        # South
+        if row + 1 < self._height and cells[row + 1][col] != self._impassable:
+            ret.append("south")
+        # West
+        if col - 1 >= 0 and cells[row][col - 1] != self._impassable:
+            ret.append("west")
+
+        return ret
+
+    def _result(self, state: Tuple[int, int], action: str) -> Tuple[int, int]:
+        """
+        Returns the state generated given the passed in
+        current_state and action
+        :param current_state: state object
+        :param action: String that represents an action
+        :return: state that is the result of applying an action to the current state
+        """
+        row, col = state
+        if action == "north":
+            return row - 1, col
+        elif action == "east":
+            return row, col + 1
+        elif action == "south":
+            return row + 1, col
+        elif action == "west":
+            return row, col - 1
+        return state
 
+    def _action_cost(self, curr_state: Tuple[int, int], action: str, next_state: Tuple[int, int]) -> float:
+        """
+        Cost of going from the current state to the next state
+        given the provided action
+        :param current: state object that represents current state
+        :param action: String that represents an action
+        :param next: state object that we will transition to
+        :return:
+        """
+        # same costs as MazeNavigation
+        row, col = curr_state if self._reversed else next_state
+        return self._costs[row][col]
+
+    def hashable_state(self, state: Tuple[int, int]) -> Any:
+        """
+        Returns a value that represents the state and is hashable. Needed
+        in order to use a state in conjunction with a dictionary like
+        the reached set.
+        :param state: State object that needs to be hashed
+        :return: object that can be hashed
+        """
+        # number of the cell, row * width + col
+        return state[0] * self._width + state[1]
+
+    def reached_set(self) -> BitSet:
+        """
+        Returns an empty set for hashable_state values with one bit per cell
+        :return: BitSet with room for every cell of the maze
+        """
+        return BitSet(self._height * self._width)
+
+    def estimated_cost(self, current: Tuple[int, int]):
+        """
+        Returns an estimate of the cost from the current state to the goal
+        :param current: current state
+        :return: cost from current state to the goal
+        """
+        # returns manhattan distance between current and goal
+        manhattan = abs(current[0] - self.goal[0]) + abs(current[1] - self.goal[1])
+        if self._landmark_estimate is None:
+            return manhattan * self._min_cost
+        # both are lower bounds, so the larger one is still admissible
+        return max(manhattan, self._landmark_estimate(current)) * self._min_cost
+
+    def maze_layout(self) -> Tuple[np.ndarray, Tuple[int, int], Tuple[int, int]]:
+        """
+        Returns the maze without the agent along with the start and goal
+        locations. Used by searches that work on the grid directly.
+        :return: maze as a 2D numpy array, (row, col) of the start and of the goal
+        """
+        return self._grid, self.initial, self.goal
+
+    def can_reach_goal(self) -> bool:
+        """
+        Returns false if the agent and the goal are in different connected
+        components of the maze. The components are labeled once per maze
+        layout and kept by the problem, so later checks, and the problems
+        made by reverse and with_endpoints, only compare two labels.
+        :return: false if there is no path to the goal
+        """
+        if self._components is None:
+            self._components = load_components(self._grid)
+        return self._components.connected(self.initial, self.goal)
+
+    def reverse(self) -> Problem:
+        """
+        Returns the problem that searches from the goal back to the
+        initial state. Moves in the maze can always be undone, so this
+        is the same maze with the initial and goal states swapped
+        :return: CoordinateMazeNavigation from the goal to the initial state
+        """
+        ret = self.with_endpoints(self.goal, self.initial)
+        ret._reversed = not self._reversed
+        return ret
+
+    def with_endpoints(self, initial: Tuple[int, int], goal: Tuple[int, int]) -> CoordinateMazeNavigation:
+        """
+        Returns a problem on the same maze layout with different initial and
+        goal locations. The layout, landmark tables and component index are
+        shared, so no grid is copied or scanned.
+        :param initial: (row, col) where the agent starts
+        :param goal: (row, col) where the agent should end
+        :return: CoordinateMazeNavigation between the two locations
+        """
+        ret = copy(self)
+        ret._initial, ret._goal = tuple(initial), tuple(goal)
+        if self._landmarks is not None:
+            ret._landmark_estimate = self._landmarks.to_goal(ret.goal)
+        return ret
+
+    def reverse_action(self, action: str) -> str:
+        """
+        Returns the action that undoes the passed in action
+        :param action: String that represents an action
+        :return: String that represents the opposite action
+        """
+        return OPPOSITE_ACTIONS[action]
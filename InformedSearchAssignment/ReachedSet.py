@@ -0,0 +1,31 @@
+class BitSet:
+    """
+    Set of the integers from 0 to size - 1 stored as one bit each in a
+    bytearray. Used as the reached set of the maze problems, whose states
+    are numbered row * width + col, so a visited cell costs one bit instead
+    of a key and a slot in a dict.
+    """
+    __slots__ = ("_bits", "_count")
+
+    def __init__(self, size: int):
+        """
+        :param size: one more than the largest integer that can be added
+        """
+        self._bits = bytearray((size + 7) >> 3)
+        self._count = 0
+
+    def add(self, value: int) -> None:
+        """adds value to the set"""
+        byte = value >> 3
+        bit = 1 << (value & 7)
+        if not self._bits[byte] & bit:
+            self._bits[byte] |= bit
+            self._count += 1
+
+    def __contains__(self, value: int) -> bool:
+        """returns true if value was added"""
+        return self._bits[value >> 3] & (1 << (value & 7)) != 0
+
+    def __len__(self) -> int:
+        """number of values in the set"""
+        return self._count
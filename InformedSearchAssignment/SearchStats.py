@@ -0,0 +1,72 @@
+from typing import List
+
+
+class SearchStats:
+    """
+    Counters a search updates while it runs. Every search takes an optional
+    SearchStats and skips all of the bookkeeping when it is None, so the
+    counters cost nothing unless they are asked for.
+    expanded: nodes taken off the frontier and expanded
+    generated: child nodes created by those expansions
+    duplicates: children dropped because their state was already reached
+    max_frontier: largest number of nodes in the frontier at one time
+    """
+    # column names for the values returned by row
+    HEADER = ["Expanded", "Generated", "Duplicates", "Max Frontier", "Branching Factor"]
+
+    def __init__(self):
+        self.expanded = 0
+        self.generated = 0
+        self.duplicates = 0
+        self.max_frontier = 0
+
+    def expanding(self, frontier_size: int, children: int) -> None:
+        """
+        Records one expansion
+        :param frontier_size: number of nodes in the frontier, including the
+        node being expanded
+        :param children: number of children the expansion generated
+        """
+        self.expanded += 1
+        self.generated += children
+        if frontier_size > self.max_frontier:
+            self.max_frontier = frontier_size
+
+    def effective_branching_factor(self, depth: int) -> float:
+        """
+        Returns the branching factor b a uniform tree of the solution depth
+        would need to contain every generated node, solving
+        generated = b + b^2 + ... + b^depth
+        :param depth: number of actions in the solution
+        :return: effective branching factor, 0 if there is no solution
+        """
+        if depth <= 0 or self.generated == 0:
+            return 0
+
+        def tree_size(b: float) -> float:
+            total = 0
+            level = 1
+            for i in range(depth):
+                level *= b
+                total += level
+                if total > self.generated:
+                    break
+            return total
+
+        low, high = 0.0, float(self.generated)
+        for i in range(60):
+            mid = (low + high) / 2
+            if tree_size(mid) < self.generated:
+                low = mid
+            else:
+                high = mid
+        return (low + high) / 2
+
+    def row(self, depth: int) -> List[float]:
+        """
+        Returns the counters in the order of HEADER
+        :param depth: number of actions in the solution
+        :return: list of values
+        """
+        return [self.expanded, self.generated, self.duplicates, self.max_frontier,
+                self.effective_branching_factor(depth)]
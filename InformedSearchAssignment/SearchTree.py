@@ -0,0 +1,74 @@
+from array import array
+from typing import Dict, List
+
+
+class SearchTree:
+    """
+    Search tree stored as parallel arrays instead of Node objects. Every
+    node is an integer id and its parent, action, path cost and depth are
+    entries in typed arrays at that index, so a node costs a few bytes
+    instead of a Python object and is never tracked by the garbage collector.
+    Actions are stored as small integer codes into a table of action names.
+    """
+
+    def __init__(self):
+        self._parent = array('q')
+        self._action = array('H')
+        self._path_cost = array('d')
+        self._depth = array('q')
+        # code 0 is the action of the root
+        self._action_names: List[str] = [None]
+        self._action_codes: Dict[str, int] = {None: 0}
+
+    def add(self, parent: int, action: str, path_cost: float, depth: int) -> int:
+        """
+        Adds a node to the tree
+        :param parent: id of the parent node, -1 for the root
+        :param action: action taken from the parent to get to this node
+        :param path_cost: cumulative cost to get to this node
+        :param depth: depth of this node within the tree
+        :return: id of the new node
+        """
+        code = self._action_codes.get(action)
+        if code is None:
+            code = len(self._action_names)
+            self._action_codes[action] = code
+            self._action_names.append(action)
+
+        self._parent.append(parent)
+        self._action.append(code)
+        self._path_cost.append(path_cost)
+        self._depth.append(depth)
+        return len(self._parent) - 1
+
+    def parent(self, node: int) -> int:
+        """returns the id of the parent of node, -1 for the root"""
+        return self._parent[node]
+
+    def action(self, node: int) -> str:
+        """returns action it took to get to node"""
+        return self._action_names[self._action[node]]
+
+    def path_cost(self, node: int) -> float:
+        """returns the cost to get to node"""
+        return self._path_cost[node]
+
+    def depth(self, node: int) -> int:
+        """returns the depth of node"""
+        return self._depth[node]
+
+    def get_path(self, node: int) -> List[str]:
+        """
+        Takes in a node id and returns the list of actions from the
+        root to that node in the same format as get_path.
+        """
+        p = []
+        while node != -1:
+            p.append(self._action_names[self._action[node]])
+            node = self._parent[node]
+        p.reverse()
+        return p
+
+    def __len__(self) -> int:
+        """number of nodes in the tree"""
+        return len(self._parent)
@@ -1,4 +1,7 @@
 from Problem import *
+from Frontier import *
+from SearchTree import SearchTree
+from SearchStats import SearchStats
 from collections import deque
 
 
@@ -16,65 +19,193 @@ def get_path(node: Node)->List[str]:
     return p
 
 
-def breadth_first_search(problem: Problem) -> Any:
+def breadth_first_search(problem: Problem, tree: SearchTree = None, stats: SearchStats = None) -> Any:
     """
     Takes in a Problem object that has an initial and goal state as
      well as search operators (metohds). Performs a Breadth First Search
      and returns the path found using the get_path method. For example,
      return get_path(node), where node is the node with a state that
       matches the goal. Returns and empty list if no path is found.
+     If a SearchTree is passed in, the search tree is kept in its arrays
+     instead of in Node objects. If a SearchStats is passed in, it is
+     updated with the number of expansions, children and duplicates.
+     Successors are streamed from problem.successors and a Node is only
+     made for the ones that were not reached before.
      """
+    if not problem.can_reach_goal():
+        return []
+
+    if tree is not None:
+        return _tree_search(problem, tree, False, stats)
+
     node = Node(problem.initial)
 
     if problem.is_goal(node.state):
         return get_path(node)
 
     frontier = deque([node])
-    reached = {problem.hashable_state(problem.initial): problem.initial}
+    reached = problem.reached_set()
+    reached.add(problem.hashable_state(problem.initial))
 
     while len(frontier) != 0:
         node = frontier.popleft()
+        if stats is not None:
+            stats.expanding(len(frontier) + 1, 0)
 
-        for child in problem.expand(node):
-            s = child.state
+        for action, s, cost in problem.successors(node.state):
+            if stats is not None:
+                stats.generated += 1
 
             if problem.is_goal(s):
-                return get_path(child)
+                return get_path(Node(s, node, action, node.path_cost + cost, node.depth + 1))
 
-            if problem.hashable_state(s) not in reached:
-               reached[problem.hashable_state(s)] = s
-               frontier.append(child) 
+            key = problem.hashable_state(s)
+            if key not in reached:
+                reached.add(key)
+                frontier.append(Node(s, node, action, node.path_cost + cost, node.depth + 1))
+            elif stats is not None:
+                stats.duplicates += 1
 
     return []
 
 
-def depth_first_search(problem: Problem) -> Any:
+def depth_first_search(problem: Problem, tree: SearchTree = None, stats: SearchStats = None) -> Any:
     """
     Takes in a Problem object that has an initial and goal state as
      well as search operators (metohds). Performs a Depth First Search
      and returns the path found using the get_path method. For example,
      return get_path(node), where node is the node with a state that
       matches the goal. Returns and empty list if no path is found.
+     If a SearchTree is passed in, the search tree is kept in its arrays
+     instead of in Node objects. If a SearchStats is passed in, it is
+     updated with the number of expansions, children and duplicates.
+     Successors are streamed from problem.successors and a Node is only
+     made for the ones that were not reached before.
      """
+    if not problem.can_reach_goal():
+        return []
+
+    if tree is not None:
+        return _tree_search(problem, tree, True, stats)
+
     node = Node(problem.initial)
 
     if problem.is_goal(node.state):
         return get_path(node)
 
     frontier = deque([node])
-    reached = {problem.hashable_state(problem.initial): problem.initial}
+    reached = problem.reached_set()
+    reached.add(problem.hashable_state(problem.initial))
 
     while len(frontier) != 0:
         node = frontier.pop()
+        if stats is not None:
+            stats.expanding(len(frontier) + 1, 0)
 
-        for child in problem.expand(node):
-            s = child.state
+        for action, s, cost in problem.successors(node.state):
+            if stats is not None:
+                stats.generated += 1
 
             if problem.is_goal(s):
-                return get_path(child)
+                return get_path(Node(s, node, action, node.path_cost + cost, node.depth + 1))
+
+            key = problem.hashable_state(s)
+            if key not in reached:
+                reached.add(key)
+                frontier.append(Node(s, node, action, node.path_cost + cost, node.depth + 1))
+            elif stats is not None:
+                stats.duplicates += 1
+
+    return []
+
+
+def uniform_cost_search(problem: Problem, frontier_type: type = HeapFrontier, stats: SearchStats = None) -> Any:
+    """
+    Takes in a Problem object that has an initial and goal state as
+     well as search operators (metohds). Performs a Uniform Cost Search
+     (Dijkstra's algorithm) and returns the path found. Returns and empty
+     list if no path is found.
+     Nodes come out of the frontier in order of path cost and the goal is
+     tested when a node is popped, so the returned path is the cheapest one
+     when action costs differ. A state reached again more cheaply lowers its
+     priority in the frontier instead of adding a second node. Successors
+     are streamed from problem.successors and a Node is only made for the
+     ones that are new or cheaper than before.
+     frontier_type is the Frontier class used to order the nodes.
+     stats is an optional SearchStats updated while searching.
+     """
+    if not problem.can_reach_goal():
+        return []
+
+    node = Node(problem.initial)
+    frontier = frontier_type()
+    key = problem.hashable_state(node.state)
+    frontier.push(key, node.path_cost, node)
+
+    reached = {key: node}
+
+    while len(frontier) != 0:
+        node = frontier.pop()
+
+        if problem.is_goal(node.state):
+            return get_path(node)
 
-            if problem.hashable_state(s) not in reached:
-               reached[problem.hashable_state(s)] = s
-               frontier.append(child) 
+        if stats is not None:
+            stats.expanding(len(frontier) + 1, 0)
 
-    return []
\ No newline at end of file
+        for action, s, cost in problem.successors(node.state):
+            if stats is not None:
+                stats.generated += 1
+
+            key = problem.hashable_state(s)
+            best = reached.get(key)
+            path_cost = node.path_cost + cost
+
+            if best is None or path_cost < best.path_cost:
+                child = Node(s, node, action, path_cost, node.depth + 1)
+                reached[key] = child
+                frontier.push(key, path_cost, child)
+            elif stats is not None:
+                stats.duplicates += 1
+
+    return []
+
+
+def _tree_search(problem: Problem, tree: SearchTree, depth_first: bool, stats: SearchStats) -> Any:
+    """
+    Breadth or Depth First Search that records the search tree in a
+    SearchTree. The frontier only holds (node id, state) pairs and the
+    successors are streamed straight into the tree, so no Node is made.
+    """
+    node_id = tree.add(-1, None, 0, 0)
+
+    if problem.is_goal(problem.initial):
+        return tree.get_path(node_id)
+
+    frontier = deque([(node_id, problem.initial)])
+    reached = problem.reached_set()
+    reached.add(problem.hashable_state(problem.initial))
+    pop = frontier.pop if depth_first else frontier.popleft
+
+    while len(frontier) != 0:
+        node_id, state = pop()
+        path_cost = tree.path_cost(node_id)
+        depth = tree.depth(node_id) + 1
+        if stats is not None:
+            stats.expanding(len(frontier) + 1, 0)
+
+        for action, s, cost in problem.successors(state):
+            if stats is not None:
+                stats.generated += 1
+
+            if problem.is_goal(s):
+                return tree.get_path(tree.add(node_id, action, path_cost + cost, depth))
+
+            key = problem.hashable_state(s)
+            if key not in reached:
+                reached.add(key)
+                frontier.append((tree.add(node_id, action, path_cost + cost, depth), s))
+            elif stats is not None:
+                stats.duplicates += 1
+
+    return []
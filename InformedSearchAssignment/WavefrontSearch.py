@@ -0,0 +1,77 @@
+from Problem import *
+from SearchStats import SearchStats
+
+
+def wavefront_search(problem: Problem, stats: SearchStats = None) -> Any:
+    """
+    Takes in a MazeNavigation or CoordinateMazeNavigation problem and
+     performs a Breadth First Search that advances the whole frontier at
+     once with NumPy instead of expanding one Node at a time. The maze is
+     flattened with a border of closed cells, so moving in a direction is
+     adding a fixed offset to every frontier index. Each cell records the
+     action that first reached it, and the path is rebuilt by walking those
+     actions back from the goal. Returns the path in the same format as
+     get_path, with the fewest moves, or an empty list if no path is found.
+     An unreachable goal is found as fast as the component index could be
+     built, so the can_reach_goal precheck is skipped.
+     stats is an optional SearchStats updated once per layer and direction.
+     Every frontier cell counts as expanded and every open neighbor as generated.
+     """
+    grid, start, goal = problem.maze_layout()
+    height, width = grid.shape
+    padded_width = width + 2
+
+    open_cells = np.zeros((height + 2, padded_width), dtype=bool)
+    open_cells[1:-1, 1:-1] = grid != 0
+    open_cells = open_cells.ravel()
+
+    # index offset of each action in the flattened, padded maze
+    offsets = [d_row * padded_width + d_col for d_row, d_col in DIRECTIONS.values()]
+
+    start = (start[0] + 1) * padded_width + start[1] + 1
+    goal = (goal[0] + 1) * padded_width + goal[1] + 1
+    if not open_cells[start] or not open_cells[goal]:
+        # a wall is never marked reached, so the path walk below would fail
+        return []
+    if start == goal:
+        return [None]
+
+    # 0 for cells not reached yet, otherwise 1 + the index of the action
+    # that reached the cell
+    reached_by = np.zeros(open_cells.shape, dtype=np.int8)
+    unreached = open_cells.copy()
+    unreached[start] = False
+
+    frontier = np.array([start], dtype=np.int64)
+    while len(frontier) != 0 and unreached[goal]:
+        layer = []
+        for a, offset in enumerate(offsets):
+            cells = frontier + offset
+            if stats is not None:
+                generated = int(np.count_nonzero(open_cells[cells]))
+                stats.generated += generated
+                stats.duplicates += generated - int(np.count_nonzero(unreached[cells]))
+            cells = cells[unreached[cells]]
+            # within one direction every frontier cell moves to a different
+            # cell, so marking them here keeps later directions from repeating them
+            unreached[cells] = False
+            reached_by[cells] = a + 1
+            layer.append(cells)
+
+        if stats is not None:
+            stats.expanded += len(frontier)
+            stats.max_frontier = max(stats.max_frontier, len(frontier))
+        frontier = np.concatenate(layer)
+
+    if unreached[goal]:
+        return []
+
+    p = []
+    cell = goal
+    while cell != start:
+        a = reached_by[cell] - 1
+        p.append(ACTIONS[a])
+        cell -= offsets[a]
+    p.append(None)
+    p.reverse()
+    return p
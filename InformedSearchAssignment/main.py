@@ -1,16 +1,71 @@
 import csv
+import json
+import os
+import platform
+import signal
+import statistics
+import subprocess
+import sys
 import tracemalloc
 import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    # only available on Unix, memory limits are skipped elsewhere
+    import resource
+except ImportError:
+    resource = None
 
 from InformedSearch import *
 from UninformedSearch import *
+from BidirectionalSearch import *
+from JumpPointSearch import *
+from Landmarks import load_landmarks
+from WavefrontSearch import *
+from SearchStats import SearchStats
+from MazeGenerator import KINDS, generate_maze, maze_id, parse_maze_id
 from mazes import *
 
+# menu option and the name used in the results file for each search
+ALGORITHMS = [("d", "DFS"), ("b", "BFS"), ("u", "UCS"), ("a", "A*"), ("g", "Greedy"),
+              ("wa", "WA*"), ("ar", "ARA*"),
+              ("bb", "BiBFS"), ("ba", "BiA*"), ("i", "IDA*"),
+              ("j", "JPS"), ("al", "A*ALT"),
+              ("v", "Wavefront")]
+
+# columns of searchResults.csv
+RESULTS_HEADER = ["Run", "Memory", "Time", "Path Length", "Path Cost"] + SearchStats.HEADER + ["Path"]
+
+# folder landmark tables are saved to so later runs reuse them, None to
+# only keep them in memory
+LANDMARK_CACHE_DIR = None
+
+# heuristic weight of weighted A* and the starting weight of ARA*
+WEIGHT = 2
+# seconds ARA* may spend improving its first path
+ARA_TIME_LIMIT = 1
 
+# generated mazes run by the size sweep, see MazeGenerator.maze_id
+SWEEP_SIZES = [100, 500, 1000, 5000]
+SWEEP_KINDS = KINDS
+SWEEP_SEED = 0
 
 
-def run_test(maze_type:int, search_type: str, print_stats: bool = True, print_maze: bool = False):
-    if maze_type == 1:
+def sweep_mazes(sizes=SWEEP_SIZES, kinds=SWEEP_KINDS, seed: int = SWEEP_SEED):
+    """
+    Returns the IDs of the generated mazes in the size sweep, smallest first
+    """
+    return [maze_id(kind, size, seed) for size in sizes for kind in kinds]
+
+
+def load_maze(maze_type):
+    """
+    Returns the initial and goal state of one of the numbered test mazes,
+    or of a generated maze when maze_type is a maze ID string
+    """
+    if isinstance(maze_type, str):
+        initial_state, goal_state = generate_maze(maze_type)
+    elif maze_type == 1:
         initial_state, goal_state = basic_maze()
     elif maze_type == 2:
         initial_state, goal_state = goaless_maze()
@@ -46,6 +101,90 @@ def run_test(maze_type:int, search_type: str, print_stats: bool = True, print_ma
         initial_state = np.array([])
         goal_state = np.array([])
 
+    return initial_state, goal_state
+
+
+def coordinate_states_for(maze_type, coordinate_states: bool) -> bool:
+    """
+    Generated mazes always use CoordinateMazeNavigation. On the large sizes a
+    grid state copies the whole maze for every successor, so the sweep could
+    not finish with grid states.
+    """
+    return coordinate_states or isinstance(maze_type, str)
+
+
+def make_problem(initial_state, goal_state, search_type: str, coordinate_states: bool = False) -> Problem:
+    """
+    Builds the problem a search runs on. Landmark tables are built once per
+    maze layout and cached, in memory and in LANDMARK_CACHE_DIR if it is
+    set, so they are loaded here instead of while the search is measured.
+    """
+    landmarks = load_landmarks(initial_state, cache_dir=LANDMARK_CACHE_DIR) if search_type == "al" else None
+
+    if coordinate_states:
+        # maze layout is stored once and states are (row, col) tuples
+        return CoordinateMazeNavigation(initial_state, goal_state, landmarks)
+    return MazeNavigation(initial_state, goal_state, landmarks)
+
+
+def run_search(p1: Problem, search_type: str, counters: SearchStats = None):
+    """
+    Runs the search picked by its menu option and returns the path
+    """
+    path = []
+    if search_type == "b":
+        path = breadth_first_search(p1, stats=counters)
+    elif search_type == "d":
+        path = depth_first_search(p1, stats=counters)
+    elif search_type == "u":
+        path = uniform_cost_search(p1, stats=counters)
+    elif search_type == "a" or search_type == "al":
+        path = a_star(p1, stats=counters)
+    elif search_type == "g":
+        path = greedy(p1, stats=counters)
+    elif search_type == "wa":
+        path = a_star(p1, stats=counters, weight=WEIGHT)
+    elif search_type == "ar":
+        # keep the best path found within the time limit
+        for path, bound in anytime_repairing_a_star(p1, WEIGHT, time_limit=ARA_TIME_LIMIT, stats=counters):
+            pass
+    elif search_type == "bb":
+        path = bidirectional_breadth_first_search(p1, stats=counters)
+    elif search_type == "ba":
+        path = bidirectional_a_star(p1, stats=counters)
+    elif search_type == "i":
+        path = iterative_deepening_a_star(p1, stats=counters)
+    elif search_type == "j":
+        path = jump_point_search(p1, stats=counters)
+    elif search_type == "v":
+        path = wavefront_search(p1, stats=counters)
+    return path
+
+
+def measure_memory(initial_state, goal_state, search_type: str, coordinate_states: bool = False) -> int:
+    """
+    Runs the search once with tracemalloc on and returns the peak number
+    of bytes allocated. Tracing slows every allocation down, so this run
+    is never used for timing. The component index is built before tracing
+    starts, as make_problem does for the landmark tables, so the first
+    search on a maze is not charged for the caches every search shares.
+    """
+    p1 = make_problem(initial_state, goal_state, search_type, coordinate_states)
+    p1.can_reach_goal()
+    tracemalloc.start()
+    try:
+        run_search(p1, search_type)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        # a search stopped by run_task's timeout must not leave tracing on
+        tracemalloc.stop()
+
+
+def run_test(maze_type, search_type: str, print_stats: bool = True, print_maze: bool = False,
+             coordinate_states: bool = False):
+    initial_state, goal_state = load_maze(maze_type)
+    coordinate_states = coordinate_states_for(maze_type, coordinate_states)
+
     if print_maze:
         # draw_maze(initial_state, goal_state, None)
         print(f"Initial state: ")
@@ -53,94 +192,265 @@ def run_test(maze_type:int, search_type: str, print_stats: bool = True, print_ma
         print(f"Goal state: ")
         print(goal_state)
 
-    p1 = MazeNavigation(initial_state, goal_state)
-
-    # memory, time, path length
-    stats = [0 for i in range(3)]
-    path = []
-    n = None
+    # memory, time, path length, path cost, then the SearchStats.HEADER counters
+    stats = [0 for i in range(4)]
+    counters = SearchStats()
 
-    start = time.time()
-    tracemalloc.start()
+    stats[0] = measure_memory(initial_state, goal_state, search_type, coordinate_states)
 
-    if search_type == "b":
-        path = breadth_first_search(p1)
-    elif search_type == "d":
-        path = depth_first_search(p1)
-    elif search_type == "a":
-        path = a_star(p1)
-    elif search_type == "g":
-        path = greedy(p1)
-
-    memory_usage = tracemalloc.get_traced_memory()
-    stats[0] = memory_usage[1]
-    tracemalloc.stop()
-    end = time.time()
+    p1 = make_problem(initial_state, goal_state, search_type, coordinate_states)
+    start = time.perf_counter()
+    path = run_search(p1, search_type, counters)
+    end = time.perf_counter()
 
     stats[1] = (end - start)
     stats[2] = len(path)
+    stats[3] = p1.path_cost(path)
+    # the path starts with the None action of the root
+    stats += counters.row(len(path) - 1)
 
     if print_stats:
         print(f"Memory usage: {stats[0]:.2e}")
         print(f"Elasped time {stats[1]:.4f}")
         print(f"Path length: {stats[2]}")
+        print(f"Path cost: {stats[3]}")
+        print(f"Expanded: {counters.expanded} Generated: {counters.generated} "
+              f"Duplicates: {counters.duplicates} Max frontier: {counters.max_frontier} "
+              f"Branching factor: {stats[-1]:.3f}")
         print(f"Path: {path}")
 
     return stats, path
 
 
+def _limit_memory(memory_limit: int):
+    """Caps the address space of a worker process at memory_limit bytes"""
+    if memory_limit is not None and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+
+def _timed_out(signum, frame):
+    raise TimeoutError
+
+
+def run_task(maze_type, search_type: str, name: str, coordinate_states: bool = False,
+             timeout: float = None) -> list:
+    """
+    Runs one (algorithm, maze) cell of the results matrix in a worker process.
+    The search is stopped with SIGALRM after timeout seconds, where the
+    platform has it, and a search that runs past the worker's memory limit
+    raises MemoryError. Either way the row records why there is no result.
+    :return: row of searchResults.csv
+    """
+    run = f"{name}_{maze_type}"
+    alarm = timeout is not None and hasattr(signal, "setitimer")
+    if alarm:
+        signal.signal(signal.SIGALRM, _timed_out)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        s, p = run_test(maze_type, search_type, False, False, coordinate_states)
+        return [run] + s + p
+    except TimeoutError:
+        reason = f"timed out after {timeout}s"
+    except MemoryError:
+        reason = "ran out of memory"
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    # the reason goes in the Path column and the other columns stay empty
+    return [run] + [""] * (len(RESULTS_HEADER) - 2) + [reason]
+
+
+def run_parallel(tasks: list, processes: int = None, timeout: float = None, memory_limit: int = None,
+                 coordinate_states: bool = False) -> list:
+    """
+    Spreads (maze, option, name) tasks over a process pool. Each worker caps
+    its memory at memory_limit bytes and each task is stopped after timeout
+    seconds, so one runaway search only loses its own row.
+    :param tasks: (maze, menu option, algorithm name) for every cell
+    :param processes: number of worker processes, None for one per core
+    :return: searchResults.csv rows in the order of tasks
+    """
+    with ProcessPoolExecutor(processes, initializer=_limit_memory, initargs=(memory_limit,)) as executor:
+        futures = [executor.submit(run_task, m, option, name, coordinate_states, timeout)
+                   for m, option, name in tasks]
+        return [future.result() for future in futures]
+
+
+def benchmark(maze_type, search_type: str, trials: int = 5, warmup: int = 1,
+              coordinate_states: bool = False) -> dict:
+    """
+    Times a search over repeated trials with perf_counter and no allocation
+    tracing, after a few untimed warmup runs that fill the landmark and
+    component caches. Memory is measured in its own run afterwards.
+    Every trial builds a new problem so no trial reuses another's state cache.
+    :return: dictionary with the timings, peak memory and search counters
+    """
+    initial_state, goal_state = load_maze(maze_type)
+    coordinate_states = coordinate_states_for(maze_type, coordinate_states)
+
+    for i in range(warmup):
+        run_search(make_problem(initial_state, goal_state, search_type, coordinate_states), search_type)
+
+    times = []
+    path = []
+    counters = SearchStats()
+    for i in range(trials):
+        p1 = make_problem(initial_state, goal_state, search_type, coordinate_states)
+        counters = SearchStats()
+        start = time.perf_counter()
+        path = run_search(p1, search_type, counters)
+        times.append(time.perf_counter() - start)
+
+    return {
+        "maze": maze_type,
+        "algorithm": search_type,
+        "coordinate_states": coordinate_states,
+        "trials": trials,
+        "warmup": warmup,
+        "times": times,
+        "min": min(times),
+        "median": statistics.median(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "memory": measure_memory(initial_state, goal_state, search_type, coordinate_states),
+        "path_length": len(path),
+        "path_cost": p1.path_cost(path),
+        "counters": dict(zip(SearchStats.HEADER, counters.row(len(path) - 1))),
+    }
+
+
+def write_scaling(results: list, filename: str):
+    """
+    Writes the median time of every generated maze run as a table with one
+    row per maze size and one column per maze kind and algorithm, ready to
+    be charted
+    :param results: benchmark results with a "run" name of algorithm_mazeID
+    :param filename: CSV file to write
+    """
+    columns = []
+    table = {}
+    for result in results:
+        if not isinstance(result["maze"], str):
+            continue
+        kind, size, seed = parse_maze_id(result["maze"])
+        column = f"{result['run'].split('_')[0]} {kind}"
+        if column not in columns:
+            columns.append(column)
+        table.setdefault(size, {})[column] = result["median"]
+
+    with open(filename, 'w') as csvfile:
+        csvwriter = csv.writer(csvfile)
+        csvwriter.writerow(["Size"] + columns)
+        for size in sorted(table):
+            csvwriter.writerow([size] + [table[size].get(column, "") for column in columns])
+
+
+def benchmark_environment() -> dict:
+    """
+    Returns what a benchmark ran on, so results files from different
+    commits or machines can be told apart
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "numpy": np.__version__,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
 if __name__ == '__main__':
     print_maze = False
     print_stats = True
+    coordinate_states = False
     filename = "searchResults.csv"
+    # benchmark mode times every run over repeated trials and writes JSON
+    benchmark_mode = False
+    trials = 5
+    warmup = 1
+    benchmark_filename = "benchmarkResults.json"
+    # parallel mode runs every (algorithm, maze) cell in a process pool
+    parallel = False
+    processes = None
+    task_timeout = 60
+    memory_limit = 4 * 1024 ** 3
+    scaling_filename = "scalingResults.csv"
 
     algorithm = input(f"Which algorithm do you want to run: "
                       f"\n(b)Breadth First Search "
                       f"\n(d)Depth First Search "
+                      f"\n(u)Uniform Cost Search "
                       f"\n(a)A* Search "
                       f"\n(g)Greedy Search "
+                      f"\n(wa)Weighted A* Search "
+                      f"\n(ar)Anytime Repairing A* Search "
+                      f"\n(bb)Bidirectional Breadth First Search "
+                      f"\n(ba)Bidirectional A* Search "
+                      f"\n(i)Iterative Deepening A* Search "
+                      f"\n(j)Jump Point Search "
+                      f"\n(al)A* Search with landmark heuristic "
+                      f"\n(v)Vectorized Wavefront Breadth First Search "
                       f"\n(c)All\n")
     num_mazes = 11
-    maze_num = input(f"Enter a number from 1 to {num_mazes} to indicate which maze you want to run or -1 for all: ")
+    maze_num = input(f"Enter a number from 1 to {num_mazes} to indicate which maze you want to run, -1 for all, "
+                     f"-2 for the generated maze size sweep or a generated maze ID such as {maze_id('rooms', 500, 0)}: ")
 
     if maze_num == "-1":
         mazes = [i + 1 for i in range(num_mazes)]
+    elif maze_num == "-2":
+        mazes = sweep_mazes()
+    elif not maze_num.lstrip("-").isdigit():
+        mazes = [maze_num]
     elif 1 <= int(maze_num) <= num_mazes:
         mazes = [int(maze_num)]
     else:
         print("Invalid maze number")
         mazes = []
 
-    stats = []
-    rows = []
-    for m in mazes:
-        print(f"\nMaze num: {m}")
-        if algorithm == "c" or algorithm == "d":
-            if print_stats:
-                print(f"DFS_{m}")
-                s, p = run_test(m, "d", print_stats, print_maze)
-            stats.append([f"DFS_{m}"] + s + p)
-        if algorithm == "c" or algorithm == "b":
-            if print_stats:
-                print(f"BFS_{m}")
-                s, p = run_test(m, "b", print_stats, print_maze)
-            stats.append([f"BFS_{m}"] + s + p)
-        if algorithm == "c" or algorithm == "a":
-            if print_stats:
-                print(f"A*_{m}")
-                s, p = run_test(m, "a", print_stats, print_maze)
-            stats.append([f"A*_{m}"] + s + p)
-        if algorithm == "c" or algorithm == "g":
-            if print_stats:
-                print(f"Greedy_{m}")
-                s, p = run_test(m, "g", print_stats, print_maze)
-            stats.append([f"Greedy_{m}"] + s + p)
-
-
-    header = ["Run", "Memory", "Time", "Path Length", "Path"]
+    if benchmark_mode:
+        results = []
+        for m in mazes:
+            for option, name in ALGORITHMS:
+                if algorithm == "c" or algorithm == option:
+                    result = benchmark(m, option, trials, warmup, coordinate_states)
+                    result["run"] = f"{name}_{m}"
+                    results.append(result)
+                    print(f"{name}_{m}: min {result['min']:.4f} median {result['median']:.4f} "
+                          f"stdev {result['stdev']:.4f} memory {result['memory']:.2e}")
 
-    with open(filename, 'w') as csvfile:
-        csvwriter = csv.writer(csvfile)
-        csvwriter.writerow(header)
-        csvwriter.writerows(stats)
+        with open(benchmark_filename, 'w') as jsonfile:
+            json.dump({"environment": benchmark_environment(), "results": results}, jsonfile, indent=2)
+        write_scaling(results, scaling_filename)
+    elif parallel:
+        tasks = [(m, option, name) for m in mazes for option, name in ALGORITHMS
+                 if algorithm == "c" or algorithm == option]
+        stats = run_parallel(tasks, processes, task_timeout, memory_limit, coordinate_states)
+
+        with open(filename, 'w') as csvfile:
+            csvwriter = csv.writer(csvfile)
+            csvwriter.writerow(RESULTS_HEADER)
+            csvwriter.writerows(stats)
+    else:
+        stats = []
+        rows = []
+        for m in mazes:
+            print(f"\nMaze num: {m}")
+            for option, name in ALGORITHMS:
+                if algorithm == "c" or algorithm == option:
+                    if print_stats:
+                        print(f"{name}_{m}")
+                    s, p = run_test(m, option, print_stats, print_maze, coordinate_states)
+                    stats.append([f"{name}_{m}"] + s + p)
+
+        with open(filename, 'w') as csvfile:
+            csvwriter = csv.writer(csvfile)
+            csvwriter.writerow(RESULTS_HEADER)
+            csvwriter.writerows(stats)
 
@@ -0,0 +1,74 @@
+from random import Random
+
+from Problem import *
+from IncrementalSearch import DStarLite
+from MazeGenerator import generate_maze
+from UninformedSearch import uniform_cost_search
+
+
+def _problem(grid, start, goal):
+    """CoordinateMazeNavigation on grid from start to goal"""
+    initial_state = np.copy(grid)
+    initial_state[start] = 2
+    goal_state = np.copy(grid)
+    goal_state[goal] = 2
+    return CoordinateMazeNavigation(initial_state, goal_state)
+
+
+def _check(planner, grid):
+    """asserts the planner's cost and path match uniform cost search on grid"""
+    problem = _problem(grid, planner.start, planner.goal)
+    expected = uniform_cost_search(problem)
+    path = planner.find_path()
+    if len(expected) == 0:
+        assert planner.cost() == float('inf')
+        assert path == []
+    else:
+        assert planner.cost() == problem.path_cost(expected)
+        assert problem.path_cost(path) == planner.cost()
+        assert problem.is_goal(_follow(planner.start, path))
+
+
+def _follow(cell, path):
+    """(row, col) reached by following path from cell"""
+    for action in path[1:]:
+        d_row, d_col = DIRECTIONS[action]
+        cell = (cell[0] + d_row, cell[1] + d_col)
+    return cell
+
+
+def test_dstar_lite(type):
+    """
+    Replays random cell edits and agent moves on a generated maze and
+    compares D* Lite against a new uniform cost search after every change
+    """
+    rng = Random(type)
+    initial_state, goal_state = generate_maze(["obstacles", "terrain", "rooms", "backtracker"][type % 4] + f"-25-s{type}")
+    grid = np.where(initial_state == 2, 1, initial_state)
+    start = tuple(int(v) for v in np.argwhere(initial_state == 2)[0])
+    goal = tuple(int(v) for v in np.argwhere(goal_state == 2)[0])
+    height, width = grid.shape
+
+    planner = DStarLite(_problem(grid, start, goal))
+    _check(planner, grid)
+    for step in range(30):
+        if step % 3 == 2:
+            # walk a few steps along the current path
+            cell = _follow(planner.start, planner.find_path()[:4])
+            if cell != planner.goal:
+                planner.move_to(cell)
+        else:
+            changes = {}
+            for i in range(rng.randint(1, 15)):
+                cell = (rng.randrange(height), rng.randrange(width))
+                if cell != planner.start and cell != planner.goal:
+                    changes[cell] = rng.choice([0, 1, -1])
+            planner.update_cells(changes)
+            for cell, value in changes.items():
+                grid[cell] = value
+        _check(planner, grid)
+
+
+if __name__ == '__main__':
+    for i in range(8):
+        test_dstar_lite(i)
@@ -1,9 +1,12 @@
 from __future__ import annotations  # needed in order to reference a Class within itself
 
-from typing import List, Any, Generic, TypeVar
+from typing import List, Any, Generic, TypeVar, Tuple
 from abc import ABC, abstractmethod
+import weakref
 import numpy as np
 
+from Reachability import load_components
+
 # https://realpython.com/python-type-checking/
 T = TypeVar('T')
 
@@ -158,6 +161,15 @@ class Problem(ABC, Generic[T]):
         """
         pass
 
+    def can_reach_goal(self) -> bool:
+        """
+        Returns false if the goal is known to be unreachable from the
+        initial state, so searches can return without exploring. Problems
+        that can not tell cheaply return true.
+        :return: false if there is no path to the goal
+        """
+        return True
+
 
 class PathFinding(Problem[np.ndarray]):
     """
@@ -179,13 +191,48 @@ class PathFinding(Problem[np.ndarray]):
         self._walkable = 1
         self._impassable = 0
 
+        # location of the agent in each state, keyed by the id of the state
+        # array. Locations are recorded as states are created, so the grid
+        # does not have to be scanned with np.where on every operator call
+        self._locations = {}
+        self._goal_location = self._location(goal_state)
+        # ComponentIndex of the maze, built by the first can_reach_goal
+        self._components = None
+
+    def _location(self, state: T) -> Tuple[int, int]:
+        """
+        Returns the (row, col) location of the agent in the passed in state.
+        The grid is only scanned for states that were not created by this problem
+        :param state: state to find the agent in
+        :return: row and col of the agent
+        """
+        entry = self._locations.get(id(state))
+        if entry is None:
+            where = np.where(state == self._character)
+            return self._remember(state, (int(where[0][0]), int(where[1][0])))
+        return entry[0]
+
+    def _remember(self, state: T, location: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Records the location of the agent in a state. The entry is removed
+        when the state is garbage collected so ids can not be confused
+        :param state: state the agent is in
+        :param location: row and col of the agent
+        :return: location that was recorded
+        """
+        key = id(state)
+        locations = self._locations
+        locations[key] = (location, weakref.ref(state, lambda ref: locations.pop(key, None)))
+        return location
+
     def is_goal(self, current: T) -> bool:
         """
         Returns true if the passed in state equals the goal state
         :param state: state to test
         :return: true or false if state equals goal
         """
-        return np.array_equal(current, self.goal)
+        # only compare the whole grid when the agent is in the right spot
+        return self._location(current) == self._goal_location and np.array_equal(current, self.goal)
 
     def expand(self, node: Node) -> List[Node]:
         """
@@ -215,8 +262,7 @@ class PathFinding(Problem[np.ndarray]):
         height, width = state.shape
 
         # gets our current location within the maze
-        row = np.where(state == self._character)[0][0]
-        col = np.where(state == self._character)[1][0]
+        row, col = self._location(state)
 
         # checks to see if there is a walkable space
         # in the four cardinal direction
@@ -246,21 +292,22 @@ class PathFinding(Problem[np.ndarray]):
 
         ret = np.copy(state)
         # gets our current location within the maze
-        row = np.where(state == self._character)[0][0]
-        col = np.where(state == self._character)[1][0]
+        row, col = self._location(state)
 
         # move from the current location
         ret[row][col] = self._walkable
 
         # move to the new location
         if action == "north":
-            ret[row - 1][col] = self._character
+            row -= 1
         elif action == "east":
-            ret[row][col + 1] = self._character
+            col += 1
         elif action == "south":
-            ret[row + 1][col] = self._character
+            row += 1
         elif action == "west":
-            ret[row][col - 1] = self._character
+            col -= 1
+        ret[row][col] = self._character
+        self._remember(ret, (row, col))
         return ret
 
     def _action_cost(self, curr_state: T, action: str, next_state: T) -> float:
@@ -274,8 +321,7 @@ class PathFinding(Problem[np.ndarray]):
         """
 
         # where we are about to step to
-        next_row = np.where(next_state == self._character)[0][0]
-        next_col = np.where(next_state == self._character)[1][0]
+        next_row, next_col = self._location(next_state)
 
         # right now the cost for all the walkable tiles is just 1
         # can be modified to add cost for different types of tiles
@@ -297,3 +343,13 @@ class PathFinding(Problem[np.ndarray]):
         # of the array
         return state.tobytes()
 
+    def can_reach_goal(self) -> bool:
+        """
+        Returns false if the agent and the goal are in different connected
+        components of the maze. The components are labeled once per maze
+        layout and kept by the problem, so later checks only compare two labels.
+        :return: false if there is no path to the goal
+        """
+        if self._components is None:
+            self._components = load_components(self.initial)
+        return self._components.connected(self._location(self.initial), self._goal_location)
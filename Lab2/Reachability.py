@@ -0,0 +1,119 @@
+import hashlib
+from collections import OrderedDict
+from typing import Tuple
+
+import numpy as np
+
+# most component indexes kept by this process before the least recently
+# used one is dropped. Each takes 4 bytes per cell of its maze
+COMPONENT_CACHE_SIZE = 4
+
+# component indexes already built by this process, keyed by grid fingerprint
+_loaded: "OrderedDict[str, ComponentIndex]" = OrderedDict()
+
+
+def _find_roots(parent: np.ndarray) -> np.ndarray:
+    """Points every node straight at the root of its tree, halving paths each pass"""
+    while True:
+        grandparent = parent[parent]
+        if np.array_equal(grandparent, parent):
+            return parent
+        parent = grandparent
+
+
+class ComponentIndex:
+    """
+    Labels every open cell of a maze with the id of its connected component,
+    after which two cells are known to be connected, or not, by comparing
+    their labels. Cells are first grouped into runs of open cells along each
+    row, then the runs joined by open cells above each other are merged with
+    a union-find run on whole arrays: every round hooks the root at one end
+    of each edge under the smaller root at the other end, then flattens the
+    trees. That is a few numpy passes instead of a python flood fill.
+    """
+
+    def __init__(self, open_cells: np.ndarray):
+        """
+        :param open_cells: boolean array, true where the maze can be walked on
+        """
+        height, width = open_cells.shape
+
+        # number every run of open cells in a row, a run starts at an open
+        # cell whose left neighbor is closed
+        starts = np.copy(open_cells)
+        starts[:, 1:] &= ~open_cells[:, :-1]
+        runs = np.cumsum(starts.ravel()).reshape(height, width) - 1
+
+        # runs with open cells above each other are connected. Only the
+        # first cell of each stretch between the same two runs is an edge
+        down = open_cells[:-1, :] & open_cells[1:, :]
+        top, bottom = runs[:-1, :], runs[1:, :]
+        edges = np.copy(down)
+        edges[:, 1:] &= ~(down[:, :-1] & (top[:, 1:] == top[:, :-1]) & (bottom[:, 1:] == bottom[:, :-1]))
+        a, b = top[edges], bottom[edges]
+
+        parent = np.arange(int(np.count_nonzero(starts)))
+        while a.size != 0:
+            root_a, root_b = parent[a], parent[b]
+            # edges inside one tree are done
+            joined = root_a != root_b
+            a, b, root_a, root_b = a[joined], b[joined], root_a[joined], root_b[joined]
+            # hooking the larger root under the smaller one never makes a cycle
+            np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+            parent = _find_roots(parent)
+
+        # renumber the roots 0, 1, 2, ... and mark impassable cells with -1
+        roots, ids = np.unique(parent, return_inverse=True)
+        flat = open_cells.ravel()
+        self._labels = np.full(flat.size, -1, dtype=np.int32)
+        self._labels[flat] = ids[runs.ravel()[flat]]
+        self._width = width
+        self._shape = (height, width)
+        self._count = len(roots)
+
+    @property
+    def labels(self) -> np.ndarray:
+        """component id of every cell, -1 for impassable cells"""
+        return self._labels.reshape(self._shape)
+
+    @property
+    def count(self) -> int:
+        """number of connected components"""
+        return self._count
+
+    def component(self, cell: Tuple[int, int]) -> int:
+        """
+        Returns the component id of a cell
+        :param cell: (row, col) of the cell
+        :return: component id or -1 if the cell is impassable
+        """
+        return int(self._labels[cell[0] * self._width + cell[1]])
+
+    def connected(self, a: Tuple[int, int], b: Tuple[int, int]) -> bool:
+        """
+        Returns true if there is a path between two cells
+        :param a: (row, col) of the first cell
+        :param b: (row, col) of the second cell
+        :return: true if both cells are open and in the same component
+        """
+        label = self.component(a)
+        return label != -1 and label == self.component(b)
+
+
+def load_components(grid: np.ndarray) -> ComponentIndex:
+    """
+    Returns the component index for a maze layout, building it the first
+    time the layout is seen by this process. Problems keep the index they
+    got, so this is only called once per problem
+    :param grid: maze as a 2D numpy array, 1s and 2s are walkable
+    :return: ComponentIndex for the maze
+    """
+    open_cells = (grid == 1) | (grid == 2)
+    key = hashlib.sha1(np.packbits(open_cells).tobytes() + repr(open_cells.shape).encode()).hexdigest()
+    if key in _loaded:
+        _loaded.move_to_end(key)
+    else:
+        _loaded[key] = ComponentIndex(open_cells)
+        if len(_loaded) > COMPONENT_CACHE_SIZE:
+            _loaded.popitem(last=False)
+    return _loaded[key]
@@ -24,6 +24,9 @@ def breadth_first_search(problem: Problem) -> Any:
      return get_path(node), where node is the node with a state that
       matches the goal. Returns and empty list if no path is found.
      """
+    if not problem.can_reach_goal():
+        return []
+
     node = Node(problem.initial)
 
     if problem.is_goal(node.state):
@@ -56,6 +59,9 @@ def depth_first_search(problem: Problem) -> Any:
      return get_path(node), where node is the node with a state that
       matches the goal. Returns and empty list if no path is found.
      """
+    if not problem.can_reach_goal():
+        return []
+
     node = Node(problem.initial)
 
     if problem.is_goal(node.state):
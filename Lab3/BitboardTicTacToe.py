@@ -0,0 +1,172 @@
+from typing import List, Tuple
+
+from Symmetry import SYMMETRIES, INVERSES
+from TicTacToe import TicTacToe
+
+# a board is a pair of 9-bit masks, one per player, with bit i set when the
+# player has moved in cell i (action i + 1)
+Bitboard = Tuple[int, int]
+
+CELLS = 9
+FULL = (1 << CELLS) - 1
+
+# the 3 rows, 3 columns and 2 diagonals as masks
+LINES: List[int] = [
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100,
+]
+
+# number of set bits of every 9-bit mask
+POPCOUNT: List[int] = [bin(mask).count("1") for mask in range(FULL + 1)]
+
+# actions left for every mask of taken cells
+ACTIONS: List[List[int]] = [[i + 1 for i in range(CELLS) if not mask >> i & 1] for mask in range(FULL + 1)]
+
+# every mask rotated or reflected by each of the SYMMETRIES
+PERMUTED: List[List[int]] = [[sum(1 << i for i in range(CELLS) if mask >> p[i] & 1) for mask in range(FULL + 1)]
+                             for p in SYMMETRIES]
+
+
+class BitboardTicTacToe(TicTacToe):
+    """
+    Tic Tac Toe game on bitboards. Works with the same searches as TicTacToe
+    but a board is a pair of masks instead of a list, so checking for a win
+    is 8 ANDs, whose turn it is comes from counting bits, and eval never
+    builds an array.
+    """
+    def __init__(self):
+        """
+        board: pair of masks for the moves of player 0 (X) and player 1 (O)
+        """
+        super().__init__()
+        self._board: Bitboard = (0, 0)
+
+    def print_board(self, board:Bitboard) -> None:
+        """
+        Prints the board as an s x s square of symbols.
+        :param board: pair of masks for the moves of players 0 and 1
+        """
+        res = ""
+        for i in range(self._s):
+            for j in range(self._s):
+                res += self._symbol[self._cell(board, i*self._s + j)]+"|"
+            res += "\n"
+        print(res)
+
+    def actions(self, board:Bitboard) -> List[int]:
+        """
+        Returns a list of possible actions left from 1-9
+        :param board: pair of masks for the moves of players 0 and 1
+        :return: List of numbers from 1-9
+        """
+        return ACTIONS[board[0] | board[1]]
+
+    def result(self, board:Bitboard, action:int) -> Bitboard:
+        """
+        Executes an action by the player whose turn it is.
+        :param board: pair of masks for the moves of players 0 and 1
+        :param action: A value from 1-9. Assumes the action is valid.
+        :return: the board with the executed move
+        """
+        bit = 1 << (action - 1)
+        if self._current_turn(board) == 0:
+            return board[0] | bit, board[1]
+        return board[0], board[1] | bit
+
+    def moves_left(self, board:Bitboard) -> int:
+        """number of empty cells"""
+        return CELLS - POPCOUNT[board[0] | board[1]]
+
+    def key(self, board:Bitboard) -> int:
+        """
+        Joins the two masks into one 18-bit integer
+        :param board: pair of masks for the moves of players 0 and 1
+        :return: number from 0 to 2^18 - 1
+        """
+        return board[0] << CELLS | board[1]
+
+    def canonical(self, board:Bitboard) -> Tuple[int, int]:
+        """
+        Returns a key shared by the board and its 7 rotations and reflections,
+        and the symmetry that maps the board onto the one the key is for.
+        :param board: pair of masks for the moves of players 0 and 1
+        :return: smallest key of the symmetric boards and its symmetry
+        """
+        x, o = board
+        return min((permuted[x] << CELLS | permuted[o], s) for s, permuted in enumerate(PERMUTED))
+
+    def distinct_actions(self, board:Bitboard) -> List[int]:
+        """
+        Returns the actions of the board without the ones that lead to a
+        rotation or reflection of the board of a lower action.
+        :param board: pair of masks for the moves of players 0 and 1
+        :return: List of numbers from 1-9
+        """
+        x, o = board
+        same = [INVERSES[s] for s in range(1, len(PERMUTED)) if PERMUTED[s][x] == x and PERMUTED[s][o] == o]
+        actions = self.actions(board)
+        if len(same) == 0:
+            return actions
+        return [a for a in actions if all(inverse[a - 1] + 1 >= a for inverse in same)]
+
+    def _current_turn(self, board:Bitboard) -> int:
+        """Player 1 moves when X has more moves. Assumes 0 ("X") goes first"""
+        return 1 if POPCOUNT[board[0]] > POPCOUNT[board[1]] else 0
+
+    def terminal(self, board:Bitboard) -> bool:
+        """
+        Returns true if a player has won or there are no moves left.
+        :param board: pair of masks for the moves of players 0 and 1
+        """
+        return self._winner(board, 0) or self._winner(board, 1) or board[0] | board[1] == FULL
+
+    def _winner(self, board:Bitboard, player:int) -> bool:
+        """
+        Checks if the player has all the cells of a line
+        :param board: pair of masks for the moves of players 0 and 1
+        :param player: id of the player (0 or 1)
+        :return: True or False if the passed in player has won
+        """
+        mask = board[player]
+        for line in LINES:
+            if mask & line == line:
+                return True
+        return False
+
+    def _utility(self, board:Bitboard, current_player:int) -> float:
+        """
+        Returns 1 if current_player has won, -1 if the other player has won
+        and 0 for a draw. Should only be called on a terminal board.
+        """
+        if self._winner(board, current_player):
+            return 1
+        elif self._winner(board, 1 - current_player):
+            return -1
+        elif board[0] | board[1] == FULL:
+            return 0
+        else:
+            raise RuntimeError("Bad board in self.utility")
+
+    def _count_options(self, board:Bitboard, player:int) -> int:
+        """
+        Counts the lines the other player has not moved in, so the player
+        could still win them
+        :param board: pair of masks for the moves of players 0 and 1
+        :param player: Either 0 or 1
+        :return: Number of lines the player could win
+        """
+        other = board[1 - player]
+        count = 0
+        for line in LINES:
+            if other & line == 0:
+                count += 1
+        return count
+
+    def _cell(self, board:Bitboard, i:int) -> int:
+        """id of the player in cell i, or the empty id"""
+        if board[0] >> i & 1:
+            return self._player[0]
+        if board[1] >> i & 1:
+            return self._player[1]
+        return self._empty
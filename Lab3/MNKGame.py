@@ -0,0 +1,237 @@
+from typing import List, NamedTuple, Tuple
+
+from TicTacToe import TicTacToe
+
+
+class MNKBoard(NamedTuple):
+    """
+    Board of an MNKGame. Everything the game asks about a board is kept
+    up to date by result, so nothing is recomputed from the cells.
+    """
+    # masks of the cells each player (0 and 1) has moved in, bit i is action i + 1
+    stones: Tuple[int, int]
+    # number of lines each player could still complete, i.e. lines the other player has not moved in
+    open_lines: Tuple[int, int]
+    # empty cells within the game's radius of a stone
+    near: int
+    # number of moves made
+    moves: int
+    # player who completed a line, or -1
+    winner: int
+
+
+class MNKGame(TicTacToe):
+    """
+    Tic Tac Toe generalized to an m x n board where a player wins with k in
+    a row, e.g. 7x7 with 4 in a row or 15x15 gomoku. Works with the same
+    searches as TicTacToe. A move only checks the lines through its cell for
+    a win and only updates the line counts of those lines, so result does
+    not depend on the size of the board. Actions are the empty cells near
+    the stones already played, since moves far from every stone are almost
+    never worth searching on a big board.
+    """
+    def __init__(self, m: int = 3, n: int = 3, k: int = 3, radius: int = 2):
+        """
+        m: number of rows
+        n: number of columns
+        k: number of stones in a row that wins
+        radius: actions are the empty cells at most radius rows and columns
+        away from a stone. On an empty board every cell is an action. Must be
+        at least 1, so a game with empty cells always has an action.
+        lines: masks of every k cells in a row, column or diagonal
+        cell_lines: masks of the lines through each cell
+        neighborhood: mask of the cells within radius of each cell
+        center_distance: squared distance of each cell from the center of
+        the board, doubled so it stays a whole number
+        """
+        super().__init__()
+        if k > max(m, n):
+            raise ValueError("k can not be longer than the board")
+        if radius < 1:
+            raise ValueError("radius must be at least 1")
+        self._m, self._n, self._k = m, n, k
+        self._cells = m * n
+
+        self._lines: List[int] = []
+        for r in range(m):
+            for c in range(n):
+                # lines starting at (r, c) going right, down and along both diagonals
+                for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                    if 0 <= end_r < m and 0 <= end_c < n:
+                        self._lines.append(sum(1 << ((r + dr * i) * n + c + dc * i) for i in range(k)))
+
+        self._cell_lines: List[List[int]] = [[line for line in self._lines if line >> i & 1]
+                                             for i in range(self._cells)]
+        self._neighborhood: List[int] = [
+            sum(1 << (r * n + c)
+                for r in range(max(0, i // n - radius), min(m, i // n + radius + 1))
+                for c in range(max(0, i % n - radius), min(n, i % n + radius + 1)))
+            for i in range(self._cells)]
+        self._center_distance: List[int] = [(2 * (i // n) - m + 1) ** 2 + (2 * (i % n) - n + 1) ** 2
+                                            for i in range(self._cells)]
+        self._all_cells = (1 << self._cells) - 1
+        self._board: MNKBoard = MNKBoard((0, 0), (len(self._lines), len(self._lines)), 0, 0, -1)
+
+    def print_board(self, board:MNKBoard) -> None:
+        """
+        Prints the board as an m x n grid of symbols.
+        :param board: MNKBoard game state
+        """
+        res = ""
+        for i in range(self._m):
+            for j in range(self._n):
+                res += self._symbol[self._cell(board, i*self._n + j)]+"|"
+            res += "\n"
+        print(res)
+
+    @property
+    def num_cells(self) -> int:
+        """number of cells on the board, actions go from 1 to m * n"""
+        return self._cells
+
+    def actions(self, board:MNKBoard) -> List[int]:
+        """
+        Returns the empty cells within radius of a stone, or every cell on an
+        empty board, numbered from 1 to m * n
+        :param board: MNKBoard game state
+        :return: List of numbers from 1 to m * n in increasing order
+        """
+        candidates = board.near if board.moves != 0 else self._all_cells
+        return self._cell_numbers(candidates)
+
+    def legal_actions(self, board:MNKBoard) -> List[int]:
+        """
+        Returns every empty cell, including the ones actions leaves out
+        because they are far from the stones
+        :param board: MNKBoard game state
+        :return: List of numbers from 1 to m * n in increasing order
+        """
+        return self._cell_numbers(self._all_cells & ~(board.stones[0] | board.stones[1]))
+
+    def _cell_numbers(self, candidates: int) -> List[int]:
+        """actions of the set bits of a mask of cells"""
+        actions = []
+        while candidates:
+            low = candidates & -candidates
+            actions.append(low.bit_length())
+            candidates ^= low
+        return actions
+
+    def result(self, board:MNKBoard, action:int) -> MNKBoard:
+        """
+        Executes an action by the player whose turn it is, updating the line
+        counts and the winner from the lines through the new stone only.
+        :param board: MNKBoard game state
+        :param action: A value from 1 to m * n. Assumes the action is valid.
+        :return: the board with the executed move
+        """
+        player = board.moves % 2
+        cell = action - 1
+        bit = 1 << cell
+        mine = board.stones[player]
+        placed = mine | bit
+        winner = board.winner
+        # lines the player had not moved in were open to the other player
+        closed = 0
+        for line in self._cell_lines[cell]:
+            if mine & line == 0:
+                closed += 1
+            if placed & line == line:
+                winner = player
+
+        stones = (placed, board.stones[1]) if player == 0 else (board.stones[0], placed)
+        open_lines = (board.open_lines[0], board.open_lines[1] - closed) if player == 0 \
+            else (board.open_lines[0] - closed, board.open_lines[1])
+        near = (board.near | self._neighborhood[cell]) & ~(stones[0] | stones[1])
+        return MNKBoard(stones, open_lines, near, board.moves + 1, winner)
+
+    def moves_left(self, board:MNKBoard) -> int:
+        """
+        Number of empty cells. Not the number of actions, which only covers
+        the cells near a stone
+        """
+        return self._cells - board.moves
+
+    def key(self, board:MNKBoard) -> int:
+        """
+        Joins the two masks into one integer
+        :param board: MNKBoard game state
+        :return: number from 0 to 2^(2mn) - 1
+        """
+        return board.stones[0] << self._cells | board.stones[1]
+
+    def canonical(self, board:MNKBoard) -> Tuple[int, int]:
+        """
+        Boards are not matched with their rotations and reflections, so this
+        is the key of the board itself
+        """
+        return self.key(board), 0
+
+    def to_canonical(self, action:int, symmetry:int) -> int:
+        return action
+
+    def from_canonical(self, action:int, symmetry:int) -> int:
+        return action
+
+    def distinct_actions(self, board:MNKBoard) -> List[int]:
+        return self.actions(board)
+
+    def move_order(self, board:MNKBoard) -> List[int]:
+        """
+        Returns the actions of the board, the ones closest to the center of
+        the board first. Actions at the same distance keep increasing order.
+        """
+        return sorted(self.actions(board), key=lambda a: self._center_distance[a - 1])
+
+    def _current_turn(self, board:MNKBoard) -> int:
+        """Assumes 0 ("X") goes first"""
+        return board.moves % 2
+
+    def terminal(self, board:MNKBoard) -> bool:
+        """
+        Returns true if a player has completed a line or there are no moves left.
+        :param board: MNKBoard game state
+        """
+        return board.winner != -1 or board.moves == self._cells
+
+    def eval(self, board:MNKBoard, current_player:int) -> float:
+        """
+        Returns the utility of a terminal board, else the difference between
+        the number of lines each player could still complete, scaled by the
+        number of lines on the board.
+        :param board: MNKBoard game state
+        :param current_player: Which player (0 or 1) is currently MAX
+        :return: a value for the current board. -1 to 1
+        """
+        if self.terminal(board):
+            return self._utility(board, current_player)
+        return (board.open_lines[current_player] - board.open_lines[1 - current_player]) / len(self._lines)
+
+    def _winner(self, board:MNKBoard, player:int) -> bool:
+        return board.winner == player
+
+    def _utility(self, board:MNKBoard, current_player:int) -> float:
+        """
+        Returns 1 if current_player has won, -1 if the other player has won
+        and 0 for a draw. Should only be called on a terminal board.
+        """
+        if board.winner == current_player:
+            return 1
+        elif board.winner == 1 - current_player:
+            return -1
+        elif board.moves == self._cells:
+            return 0
+        else:
+            raise RuntimeError("Bad board in self.utility")
+
+    def _count_options(self, board:MNKBoard, player:int) -> int:
+        return board.open_lines[player]
+
+    def _cell(self, board:MNKBoard, i:int) -> int:
+        """id of the player in cell i, or the empty id"""
+        if board.stones[0] >> i & 1:
+            return self._player[0]
+        if board.stones[1] >> i & 1:
+            return self._player[1]
+        return self._empty
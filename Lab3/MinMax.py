@@ -1,8 +1,10 @@
 from typing import Tuple, Any, List
 
 from TicTacToe import *
+from TranspositionTable import TranspositionTable, EXACT, LOWER, UPPER
 
-def minimax_search(game:TicTacToe, board:List[int], current_player:int) -> list[Any]:
+def minimax_search(game:TicTacToe, board:List[int], current_player:int,
+                   table: TranspositionTable = None) -> list[Any]:
     """
     Start of the minimax algorithm
     :param game: Instance of a game
@@ -11,13 +13,49 @@ def minimax_search(game:TicTacToe, board:List[int], current_player:int) -> list[
     2s indicate an empty space
     :param current_player: ID of the max player and player for which utility
     scores are calculated. This can either be 0 or 1.
+    :param table: optional TranspositionTable, kept between calls, that
+    stores the value of every searched position
     :return: value and action that corresponds to the optimal move
     """
-    value, action = max_value(game, board, 0, current_player)
-    return [value,action]
+    if game.is_cutoff(board, 0):
+        return [game.eval(board, current_player), None]
+
+    # the root is searched rather than looked up, since a stored move may
+    # be a rotation of the lowest numbered best move this search returns
+    v, action = float('-inf'), None
+    for a in game.actions(board):
+        v2, a2 = min_value(game, game.result(board, a), 1, current_player, table)
+        if v2 > v:
+            v, action = v2, a
+    return [v, action]
+
+
+def _searched_depth(game, board, d) -> int:
+    """
+    Number of moves searched below a board at depth d. A search that can
+    reach every end of the game is as good as any deeper one, so it is
+    capped at the number of moves left. Stored values are only reused for
+    the same searched depth: a shallower search would have used eval where
+    a deeper one did not, so reusing a deeper value would change the result
+    compared to searching without a table.
+    """
+    return min(game.depth_limit - d, game.moves_left(board))
+
+
+def _table_key(game, board, d, current_player, maximizing):
+    """
+    Key of a board in the transposition table, shared by its rotations and
+    reflections, the symmetry that maps moves to and from the stored board,
+    and the number of moves searched below the board. The key also holds
+    whether the board was searched as a max or a min node, since the same
+    board can be either: the turn to move decides it when current_player
+    starts the search, the depth does when the other player does.
+    """
+    key, symmetry = game.canonical(board)
+    return (key, current_player, maximizing), symmetry, _searched_depth(game, board, d)
 
 
-def max_value(game, board, d, current_player) -> list[Any]:
+def max_value(game, board, d, current_player, table=None) -> list[Any]:
     """
     Recursive function to find the max of possible successors
     to the game board.
@@ -28,6 +66,7 @@ def max_value(game, board, d, current_player) -> list[Any]:
     :param d: Maximum depth minimax can go
     :param current_player: ID of the max player and player for which utility
     scores are calculated. This can either be 0 or 1.
+    :param table: optional TranspositionTable of exact values
     :return: value and action that corresponds to the optimal move
     """
 
@@ -35,19 +74,28 @@ def max_value(game, board, d, current_player) -> list[Any]:
     # actual max_value code
     if game.is_cutoff(board, d):
         return game.eval(board, current_player), None
+
+    if table is not None:
+        key, symmetry, depth = _table_key(game, board, d, current_player, True)
+        entry = table.get(key)
+        if entry is not None and entry[2] == EXACT and entry[1] == depth:
+            return entry[0], game.from_canonical(entry[3], symmetry)
+
     v = float('-inf')
 
     for a in game.actions(board):
-        v2, a2 = min_value(game, game.result(board, a), d+1, current_player)
+        v2, a2 = min_value(game, game.result(board, a), d+1, current_player, table)
 
         if v2 > v:
             v, move = v2, a
 
+    if table is not None:
+        table.put(key, v, depth, EXACT, game.to_canonical(move, symmetry))
     return v, move
     
 
 
-def min_value(game, board, d, current_player):
+def min_value(game, board, d, current_player, table=None):
     """
     Recursive function to find the min of possible successors
     to the game board.
@@ -58,17 +106,191 @@ def min_value(game, board, d, current_player):
     :param d: Maximum depth minimax can go
     :param current_player: ID of the max player and player for which utility
     scores are calculated. This can either be 0 or 1.
+    :param table: optional TranspositionTable of exact values
     :return: value and action that corresponds to the optimal move
     """
 
     if game.is_cutoff(board, d):
         return game.eval(board, current_player), None
 
+    if table is not None:
+        key, symmetry, depth = _table_key(game, board, d, current_player, False)
+        entry = table.get(key)
+        if entry is not None and entry[2] == EXACT and entry[1] == depth:
+            return entry[0], game.from_canonical(entry[3], symmetry)
+
     v = float('inf')
 
     for a in game.actions(board):
-        v2, a2 = max_value(game, game.result(board, a), d+1, current_player)
+        v2, a2 = max_value(game, game.result(board, a), d+1, current_player, table)
         if v2 < v:
             v, move = v2, a
 
+    if table is not None:
+        table.put(key, v, depth, EXACT, game.to_canonical(move, symmetry))
     return v, move
+
+
+def alpha_beta_search(game:TicTacToe, board:List[int], current_player:int,
+                      table: TranspositionTable = None) -> list[Any]:
+    """
+    Minimax with alpha-beta pruning. Returns the same value and action as
+    minimax_search but skips the boards that can not change the result.
+    Moves are tried center first, then corners, then the best move found
+    earlier at the same depth, then the rest, so good moves come first and
+    more of the tree is pruned.
+    :param game: Instance of a game
+    :param board: List of 0s, 1s, and 2s that represents the state of the board.
+    0s indicate where player 1 has moved, 1 indicates where player 2 has moved, and
+    2s indicate an empty space
+    :param current_player: ID of the max player and player for which utility
+    scores are calculated. This can either be 0 or 1.
+    :param table: optional TranspositionTable, kept between calls, that
+    stores the value or bound found for every searched position
+    :return: value and action that corresponds to the optimal move
+    """
+    if game.is_cutoff(board, 0):
+        return [game.eval(board, current_player), None]
+
+    # best move found so far at each depth
+    best_moves = {}
+    v, move = float('-inf'), None
+
+    for a in _ordered_actions(game, board, None):
+        v2 = ab_min_value(game, game.result(board, a), 1, current_player, v, float('inf'), best_moves, table)
+        if v2 > v or (v2 == v and a < move):
+            if v2 == v:
+                # a child cut off at alpha only returns an upper bound, so
+                # check it really ties before preferring the lower action
+                # like minimax_search does
+                v2 = ab_min_value(game, game.result(board, a), 1, current_player,
+                                  float('-inf'), float('inf'), best_moves, table)
+                if v2 != v:
+                    continue
+            v, move = v2, a
+
+    return [v, move]
+
+
+def _ordered_actions(game, board, best_move) -> List[int]:
+    """
+    Returns the actions of board in the game's move_order, with best_move
+    moved to the front. Moves that only lead to a rotation or reflection of
+    another move's board are left out.
+    """
+    ordered = game.move_order(board)
+    if best_move in ordered:
+        ordered.remove(best_move)
+        ordered.insert(0, best_move)
+    return ordered
+
+
+def _probe(game, board, d, current_player, maximizing, alpha, beta, table):
+    """
+    Looks a board up in the transposition table
+    :return: key, symmetry and searched depth of the board, the stored value
+    if it settles the board for this alpha and beta (else None), and the
+    stored best move turned back to the board (else None)
+    """
+    key, symmetry, depth = _table_key(game, board, d, current_player, maximizing)
+    entry = table.get(key)
+    if entry is None:
+        return key, symmetry, depth, None, None
+
+    value, entry_depth, bound, move = entry
+    move = game.from_canonical(move, symmetry)
+    if entry_depth == depth and (bound == EXACT or (bound == LOWER and value >= beta)
+                                 or (bound == UPPER and value <= alpha)):
+        return key, symmetry, depth, value, move
+    return key, symmetry, depth, None, move
+
+
+def _bound(v, alpha, beta) -> int:
+    """bound type of value v searched with the window alpha, beta"""
+    if v <= alpha:
+        return UPPER
+    if v >= beta:
+        return LOWER
+    return EXACT
+
+
+def ab_max_value(game, board, d, current_player, alpha, beta, best_moves, table=None) -> float:
+    """
+    Recursive function to find the max of possible successors
+    to the game board, skipping successors once the value reaches beta.
+    :param game: Instance of a game
+    :param board: List of 0s, 1s, and 2s that represents the state of the board.
+    :param d: current depth
+    :param current_player: ID of the max player and player for which utility
+    scores are calculated. This can either be 0 or 1.
+    :param alpha: best value MAX can already get higher up in the tree
+    :param beta: best value MIN can already get higher up in the tree
+    :param best_moves: best move found so far at each depth, updated in place
+    :param table: optional TranspositionTable
+    :return: value of the board, or a value of at least beta if pruned
+    """
+    if game.is_cutoff(board, d):
+        return game.eval(board, current_player)
+
+    best_move = best_moves.get(d)
+    if table is not None:
+        key, symmetry, depth, value, move = _probe(game, board, d, current_player, True, alpha, beta, table)
+        if value is not None:
+            return value
+        best_move = move if move is not None else best_move
+        window = alpha, beta
+
+    v = float('-inf')
+    for a in _ordered_actions(game, board, best_move):
+        v2 = ab_min_value(game, game.result(board, a), d+1, current_player, alpha, beta, best_moves, table)
+        if v2 > v:
+            v = v2
+            best_moves[d] = a
+        if v >= beta:
+            break
+        alpha = max(alpha, v)
+
+    if table is not None:
+        table.put(key, v, depth, _bound(v, *window), game.to_canonical(best_moves[d], symmetry))
+    return v
+
+
+def ab_min_value(game, board, d, current_player, alpha, beta, best_moves, table=None) -> float:
+    """
+    Recursive function to find the min of possible successors
+    to the game board, skipping successors once the value reaches alpha.
+    :param game: Instance of a game
+    :param board: List of 0s, 1s, and 2s that represents the state of the board.
+    :param d: current depth
+    :param current_player: ID of the max player and player for which utility
+    scores are calculated. This can either be 0 or 1.
+    :param alpha: best value MAX can already get higher up in the tree
+    :param beta: best value MIN can already get higher up in the tree
+    :param best_moves: best move found so far at each depth, updated in place
+    :param table: optional TranspositionTable
+    :return: value of the board, or a value of at most alpha if pruned
+    """
+    if game.is_cutoff(board, d):
+        return game.eval(board, current_player)
+
+    best_move = best_moves.get(d)
+    if table is not None:
+        key, symmetry, depth, value, move = _probe(game, board, d, current_player, False, alpha, beta, table)
+        if value is not None:
+            return value
+        best_move = move if move is not None else best_move
+        window = alpha, beta
+
+    v = float('inf')
+    for a in _ordered_actions(game, board, best_move):
+        v2 = ab_max_value(game, game.result(board, a), d+1, current_player, alpha, beta, best_moves, table)
+        if v2 < v:
+            v = v2
+            best_moves[d] = a
+        if v <= alpha:
+            break
+        beta = min(beta, v)
+
+    if table is not None:
+        table.put(key, v, depth, _bound(v, *window), game.to_canonical(best_moves[d], symmetry))
+    return v
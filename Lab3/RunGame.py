@@ -1,5 +1,8 @@
-from MinMax import minimax_search
+from MinMax import minimax_search, alpha_beta_search
 from TicTacToe import TicTacToe
+from BitboardTicTacToe import BitboardTicTacToe
+from MNKGame import MNKGame
+from TranspositionTable import TranspositionTable
 
 
 def game_loop(game, player):
@@ -8,6 +11,8 @@ def game_loop(game, player):
     state and then prints the result
     """
     player_id = 0 #id of the current player
+    # positions searched on earlier turns are looked up instead of searched again
+    table = TranspositionTable()
     game_over = False
     while not game_over:
 
@@ -17,15 +22,18 @@ def game_loop(game, player):
         print("Current player: " + str(game.symbol[player_id])+" ("+player[player_id]+")")
 
         if player[player_id] == "human":
-            move = int(input("Enter a move (1-9): "))
+            move = int(input(f"Enter a move (1-{game.num_cells}): "))
         elif player[player_id] == "minimax":
-            [value, move] = minimax_search(game,game.board,player_id)
+            [value, move] = minimax_search(game,game.board,player_id, table)
              # print(value,move)
+        elif player[player_id] == "alphabeta":
+            [value, move] = alpha_beta_search(game, game.board, player_id, table)
         else:
             move = game.random_move(game.board)
 
         print("Action: "+str(move))
-        actions = game.actions(game.board)
+        # a human may move anywhere empty, not just where the AI searches
+        actions = game.legal_actions(game.board)
         if move in actions:
             game.board = game.result(game.board, move)
             if game.terminal(game.board):
@@ -41,12 +49,13 @@ def game_loop(game, player):
 
 def set_players(players):
     """
-    Allows you to set player 0 and 1 to either a human, random move, or minimax move
+    Allows you to set player 0 and 1 to either a human, random move, minimax move,
+    or alpha-beta move
     :param players:
     :return:
     """
     for i in range(len(players)):
-        prompt = "Set Player " + str(i+1) + ":" + "\n\t1:Human" + "\n\t2:Random\n" + "\t3:Minimax\n"
+        prompt = "Set Player " + str(i+1) + ":" + "\n\t1:Human" + "\n\t2:Random\n" + "\t3:Minimax\n" + "\t4:Alpha-beta\n"
         option = int(input(prompt))
         if option == 1:
             players[i] = "human"
@@ -54,6 +63,8 @@ def set_players(players):
             players[i] = "random"
         elif option == 3:
             players[i] = "minimax"
+        elif option == 4:
+            players[i] = "alphabeta"
 
     print("")
 
@@ -73,7 +84,7 @@ def program_loop():
     while run_program:
         print("Current players:")
         print("\tPlayer1:"+player[0]+"\n\tPlayer2:"+player[1]+"\n")
-        prompt = "Options:" + "\n\t1.Set Players" + "\n\t2.Play Game\n"
+        prompt = "Options:" + "\n\t1.Set Players" + "\n\t2.Play Game" + "\n\t3.Play Game (bitboard engine)" + "\n\t4.Play Game (m x n board, k in a row)\n"
 
         option = int(input(prompt))
         if option == 0:
@@ -82,6 +93,11 @@ def program_loop():
             set_players(player)
         elif option == 2:
             game_loop(TicTacToe(), player)
+        elif option == 3:
+            game_loop(BitboardTicTacToe(), player)
+        elif option == 4:
+            m, n, k = [int(x) for x in input("Enter rows, columns and k in a row (e.g. 7 7 4): ").split()]
+            game_loop(MNKGame(m, n, k), player)
         else:
             "Invalid choice "+str(option)
 
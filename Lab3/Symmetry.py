@@ -0,0 +1,97 @@
+from typing import List, Tuple
+
+# size of the board the tables are built for
+SIZE = 3
+
+
+def _permutation(transform) -> List[int]:
+    """
+    Returns the permutation p of the cells where the transformed board has
+    board[p[i]] in cell i
+    :param transform: function from the (row, col) of a cell of the
+    transformed board to the (row, col) it comes from
+    """
+    return [r * SIZE + c for r, c in (transform(i // SIZE, i % SIZE) for i in range(SIZE * SIZE))]
+
+
+_last = SIZE - 1
+
+# the 8 rotations and reflections of the board, identity first
+SYMMETRIES: List[List[int]] = [
+    _permutation(lambda r, c: (r, c)),
+    _permutation(lambda r, c: (_last - c, r)),
+    _permutation(lambda r, c: (_last - r, _last - c)),
+    _permutation(lambda r, c: (c, _last - r)),
+    _permutation(lambda r, c: (r, _last - c)),
+    _permutation(lambda r, c: (_last - r, c)),
+    _permutation(lambda r, c: (c, r)),
+    _permutation(lambda r, c: (_last - c, _last - r)),
+]
+
+# cell of the transformed board that each cell of the board moves to
+INVERSES: List[List[int]] = [[p.index(i) for i in range(SIZE * SIZE)] for p in SYMMETRIES]
+
+# weight of each cell of the board in the base-3 key of each transformed
+# board, so a key is a dot product instead of building the board
+_WEIGHTS: List[List[int]] = [[3 ** inverse[i] for i in range(SIZE * SIZE)] for inverse in INVERSES]
+
+
+def transform(board: List[int], symmetry: int) -> List[int]:
+    """
+    Returns the board rotated or reflected by one of the SYMMETRIES
+    :param board: List of 0s, 1s, and 2s that represent a game state.
+    :param symmetry: index into SYMMETRIES
+    :return: transformed copy of the board
+    """
+    return [board[i] for i in SYMMETRIES[symmetry]]
+
+
+def canonical(board: List[int]) -> Tuple[int, int]:
+    """
+    Returns the smallest base-3 key of the 8 symmetric versions of a board,
+    which is the same for all of them, and the symmetry that gives it
+    :param board: List of 0s, 1s, and 2s that represent a game state.
+    :return: canonical key and index into SYMMETRIES
+    """
+    best, symmetry = None, 0
+    for s, weights in enumerate(_WEIGHTS):
+        key = sum(w * cell for w, cell in zip(weights, board))
+        if best is None or key < best:
+            best, symmetry = key, s
+    return best, symmetry
+
+
+def to_canonical(action: int, symmetry: int) -> int:
+    """
+    Maps a move on a board to the same move on the board transformed by symmetry
+    :param action: move from 1-9 in the board's orientation
+    :param symmetry: index into SYMMETRIES
+    :return: move from 1-9 in the transformed orientation
+    """
+    return INVERSES[symmetry][action - 1] + 1
+
+
+def from_canonical(action: int, symmetry: int) -> int:
+    """
+    Maps a move on a board transformed by symmetry back to the original board
+    :param action: move from 1-9 in the transformed orientation
+    :param symmetry: index into SYMMETRIES
+    :return: move from 1-9 in the board's orientation
+    """
+    return SYMMETRIES[symmetry][action - 1] + 1
+
+
+def distinct_actions(board: List[int], actions: List[int]) -> List[int]:
+    """
+    Drops the moves that lead to a board symmetric to the board of an
+    earlier move. Only happens when the board itself is symmetric, for
+    example the empty board has just 3 different first moves.
+    :param board: List of 0s, 1s, and 2s that represent a game state.
+    :param actions: legal moves from 1-9 in increasing order
+    :return: the lowest numbered move of each group of symmetric moves
+    """
+    same = [inverse for inverse, p in zip(INVERSES[1:], SYMMETRIES[1:])
+            if all(board[p[i]] == board[i] for i in range(SIZE * SIZE))]
+    if len(same) == 0:
+        return actions
+    return [a for a in actions if all(inverse[a - 1] + 1 >= a for inverse in same)]
@@ -1,11 +1,16 @@
 from copy import copy
 from random import randint
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 
+import Symmetry
+
 DEPTH_LIMIT = 2
 
+# order moves are searched in: center, then corners, then edges
+MOVE_ORDER = [5, 1, 3, 7, 9, 2, 4, 6, 8]
+
 class TicTacToe:
     """
     Class that represents a Tic Tac Toe game. Includes methods to
@@ -51,6 +56,16 @@ class TicTacToe:
     def board(self, b: List[int]):
         self._board = b
 
+    @property
+    def num_cells(self) -> int:
+        """number of spaces on the board, actions go from 1 to num_cells"""
+        return self._s * self._s
+
+    @property
+    def depth_limit(self) -> int:
+        """number of moves the searches look ahead before using eval"""
+        return DEPTH_LIMIT
+
     def print_board(self, board:List[int]) -> None:
         """
         Prints the elements of the 1D list as an s x s square.
@@ -112,6 +127,15 @@ class TicTacToe:
         """
         return [i + 1 for i in range(len(board)) if board[i] == self._empty]
 
+    def legal_actions(self, board:List[int]) -> List[int]:
+        """
+        Returns every move a player may make. The same as actions here, but
+        games whose actions skip moves not worth searching return them all.
+        :param board: List of 0s, 1s, and 2s that represent a game state.
+        :return: List of numbers from 1-9
+        """
+        return self.actions(board)
+
     def result(self, board:List[int], action:int) -> List[int]:
         """
         Executes an action by the current player p. This involves
@@ -126,6 +150,73 @@ class TicTacToe:
         new_board[action - 1] = player
         return new_board
 
+    def moves_left(self, board:List[int]) -> int:
+        """
+        Returns the number of empty spaces, the most moves the game can last
+        :param board: List of 0s, 1s, and 2s that represent a game state.
+        :return: number from 0-9
+        """
+        return board.count(self._empty)
+
+    def key(self, board:List[int]) -> int:
+        """
+        Encodes the board as a base-3 integer, one digit per cell, so every
+        one of the 3^9 boards has its own small hashable key.
+        :param board: List of 0s, 1s, and 2s that represent a game state.
+        :return: number from 0 to 3^9 - 1
+        """
+        k = 0
+        for cell in reversed(board):
+            k = k * 3 + cell
+        return k
+
+    def canonical(self, board:List[int]) -> Tuple[int, int]:
+        """
+        Returns a key shared by the board and its 7 rotations and reflections,
+        which all have the same value, and the symmetry that maps the board
+        onto the one the key is for.
+        :param board: List of 0s, 1s, and 2s that represent a game state.
+        :return: smallest key of the symmetric boards and its symmetry
+        """
+        return Symmetry.canonical(board)
+
+    def to_canonical(self, action:int, symmetry:int) -> int:
+        """
+        Maps a move on a board to the board its canonical key is for
+        :param action: A value from 1-9
+        :param symmetry: symmetry returned by canonical for the board
+        :return: A value from 1-9
+        """
+        return Symmetry.to_canonical(action, symmetry)
+
+    def from_canonical(self, action:int, symmetry:int) -> int:
+        """
+        Maps a move on the board a canonical key is for back to the board
+        :param action: A value from 1-9
+        :param symmetry: symmetry returned by canonical for the board
+        :return: A value from 1-9
+        """
+        return Symmetry.from_canonical(action, symmetry)
+
+    def distinct_actions(self, board:List[int]) -> List[int]:
+        """
+        Returns the actions of the board without the ones that lead to a
+        rotation or reflection of the board of a lower action.
+        :param board: List of 0s, 1s, and 2s that represent a game state.
+        :return: List of numbers from 1-9
+        """
+        return Symmetry.distinct_actions(board, self.actions(board))
+
+    def move_order(self, board:List[int]) -> List[int]:
+        """
+        Returns the distinct actions of the board, the moves most likely to
+        be good first: center, then corners, then edges.
+        :param board: List of 0s, 1s, and 2s that represent a game state.
+        :return: List of numbers from 1-9
+        """
+        actions = self.distinct_actions(board)
+        return [a for a in MOVE_ORDER if a in actions]
+
     def _current_turn(self, board:List[int]) -> int:
         """Evaluates the board and figures out whose turn it is.
         :param board: List of 0s, 1s, and 2s that represent a game state.
@@ -247,7 +338,7 @@ class TicTacToe:
 
         #number of cols with just the current_player or empty
         for i in range(np_board.shape[1]):
-            if ((np_board[:, i] == player) + (np_board[i, :] == self._empty)).all():
+            if ((np_board[:, i] == player) + (np_board[:, i] == self._empty)).all():
                 count += 1
 
         #number of diags with just the current_player or emtpy
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from typing import Any, Tuple
+
+# bound types of a stored value
+EXACT = 0
+# the value is a lower bound, the search was cut off at beta
+LOWER = 1
+# the value is an upper bound, the search was cut off at alpha
+UPPER = 2
+
+# 3^9 boards for each of the two max players is every TicTacToe position
+DEFAULT_SIZE = 2 * 3 ** 9
+
+
+class TranspositionTable:
+    """
+    Remembers the value of positions already searched so a position reached
+    again, by a different move order or on a later turn, is a dictionary
+    lookup instead of a subtree. Entries store the value, the depth it was
+    searched to, the bound type and the best move. When the table is full
+    the least recently used entry is evicted.
+    """
+
+    def __init__(self, size: int = DEFAULT_SIZE):
+        """
+        :param size: most entries kept before evicting
+        """
+        self._size = size
+        # key -> (value, depth, bound, move)
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any) -> Tuple[float, int, int, Any]:
+        """
+        Returns the entry stored for a position
+        :param key: position key, usually game.key(board) and the max player
+        :return: (value, depth, bound, move) or None if the position is not stored
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Any, value: float, depth: int, bound: int, move: Any = None) -> None:
+        """
+        Stores the result of searching a position, evicting the least
+        recently used entry if the table is full
+        :param key: position key, usually game.key(board) and the max player
+        :param value: value found by the search
+        :param depth: number of moves searched below the position
+        :param bound: EXACT, LOWER or UPPER
+        :param move: best move found, used to order the moves next time
+        """
+        entries = self._entries
+        entries[key] = (value, depth, bound, move)
+        entries.move_to_end(key)
+        if len(entries) > self._size:
+            entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """removes every entry"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """number of stored positions"""
+        return len(self._entries)